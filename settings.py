@@ -1,5 +1,8 @@
 # settings.py
 
+import os
+import sys
+import logging
 from pathlib import Path
 
 # ─────────────────────────────────────────────────────────────
@@ -37,3 +40,47 @@ DB_FILE = DB_DIR / "energie_data.sqlite"
 HTTP_TIMEOUT = 10  # default timeout voor API-calls
 DEFAULT_ATTEMPTS = 3    # default aantal pogingen bij fouten
 RETRY_DELAY   = 5  # default wachttijd bij retry
+HTTP_MAX_WORKERS = 8  # maximaal aantal gelijktijdige API-verzoeken (dagen) bij het ophalen van forecasts
+IMPORT_MAX_WORKERS = 4  # maximaal aantal maanden (wind/zon) dat gelijktijdig opgehaald wordt in update_data
+
+# ─────────────────────────────────────────────────────────────
+# Compressieniveau (0-9) voor de jaarlijkse zips met forecastdata.
+# 1 comprimeert ruim dubbel zo snel als de zlib-standaard 6, voor zips die ongeveer een derde groter zijn.
+ZIP_COMPRESSLEVEL = 1
+
+# ─────────────────────────────────────────────────────────────
+# Controle van vereiste packages bij het importeren van de modules
+# Zet de omgevingsvariabele SKIP_DEP_CHECK=1 in een reeds ingerichte omgeving
+# (bv. na `pip install -r requirements.txt`) om de versiecontrole over te slaan.
+SKIP_DEP_CHECK = os.environ.get("SKIP_DEP_CHECK", "").strip().lower() in ("1", "true", "ja", "yes")
+
+# ─────────────────────────────────────────────────────────────
+# Logging: tijdstempel en bericht, zoals de print-uitvoer van de scripts.
+# Enkel de logger van het project ("src") wordt ingesteld; de root-logger (en dus de logging van
+# de notebook en van libraries zoals matplotlib of webdriver_manager) blijft ongemoeid.
+# Het tijdstip wordt pas opgemaakt wanneer een bericht effectief getoond wordt;
+# met bv. logging.getLogger("src").setLevel(logging.WARNING) kan de uitvoer beperkt worden.
+class _StdoutHandler(logging.Handler):
+    """Schrijft steeds naar de huidige sys.stdout, ook als die later omgeleid wordt (DualLogger, Jupyter)."""
+
+    def emit(self, record):
+        try:
+            sys.stdout.write(self.format(record) + "\n")
+        except Exception:
+            self.handleError(record)
+
+    def flush(self):
+        with self.lock:
+            if hasattr(sys.stdout, "flush"):
+                sys.stdout.flush()
+
+
+LOG_FORMAT = "%(asctime)s - %(message)s"
+LOG_DATEFMT = "%Y-%m-%d %H:%M:%S"
+_project_logger = logging.getLogger("src")
+if not _project_logger.handlers:
+    _handler = _StdoutHandler()
+    _handler.setFormatter(logging.Formatter(LOG_FORMAT, datefmt=LOG_DATEFMT))
+    _project_logger.addHandler(_handler)
+    _project_logger.setLevel(logging.INFO)
+    _project_logger.propagate = False
@@ -14,6 +14,7 @@ Functies:
   - Kolommen = maandnamen (taal instelbaar via `localization.py`)
 - Ondersteuning voor meertalige maandnamen (NL/FR/EN, kort of volledig).
 - Gescheiden functies voor ruwe dataframes en geaggregeerde pivot-tabellen.
+- Resultaten van de datafuncties worden bewaard zolang de database niet wijzigt.
 - Compatibel met visualisatie- en analysetools in `visualisation_tools.py`.
 """
 
@@ -23,62 +24,167 @@ Functies:
 
 import sqlite3
 import os
-from typing import Literal, Union, List
-from settings import DB_FILE
-from datetime import datetime
+import logging
+import atexit
+import functools
+import threading
+import warnings
+from typing import Literal, Union, List, Dict, Optional, Sequence, Tuple, Iterator
+from settings import DB_FILE, SKIP_DEP_CHECK
 from src.utils.localization import get_month_name, get_weekday_name, LangCode, TRANSLATIONS
 from src.utils.package_tools import update_or_install_if_missing
+from src.utils.decorators import cache_per_version
 from src.data_import_tools import unzip_all_forecast_zips
-from src.database_tools import to_sql
+from src.database_tools import to_sql, init_schema
 
 # Controleer en installeer indien nodig de vereiste modules
 # Dit is een vangnet als de gebruiker geen rekening houdt met requirements.txt.
-update_or_install_if_missing("pandas","1.3.0")
+# In een reeds ingerichte omgeving kan deze controle overgeslagen worden via SKIP_DEP_CHECK=1.
+if not SKIP_DEP_CHECK:
+    update_or_install_if_missing("pandas","2.2.0")
 
 # Pas na installatie importeren
+import numpy as np
 import pandas as pd
 
+log = logging.getLogger(__name__)
+
 
 # -------------------------------------------------------------------
-# 🔧 Database-initiatie bij import
+# 🔧 Database-initiatie bij de eerste query
 # -------------------------------------------------------------------
 
 def _initialize_database():
     """
     Controleer of de SQLite-database bestaat en minstens 1 MB groot is. 
     Zo niet, unzip bestanden en bouw de database op.
+    Bestaat ze wel, dan worden enkel ontbrekende views en maandtotalen aangemaakt (via `init_schema`).
     """
     if not os.path.exists(DB_FILE) or os.path.getsize(DB_FILE) < 1_000_000:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ℹ️ Database '{os.path.basename(DB_FILE)}' bestaat niet. Initialisatie gestart...")
+        log.info("ℹ️ Database '%s' bestaat niet. Initialisatie gestart...", os.path.basename(DB_FILE))
 
         # Unzip alle benodigde bestanden
         try:
             unzip_all_forecast_zips()
         except Exception as e:
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ❌ Fout bij unzippen: {e}")
+            log.error("❌ Fout bij unzippen: %s", e)
             return False
 
         # Maak en vul de database
         try:
             to_sql()
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ✅ Database succesvol aangemaakt en gevuld.")
+            log.info("✅ Database succesvol aangemaakt en gevuld.")
+        except Exception as e:
+            log.error("❌ Fout bij database-opbouw: %s", e)
+            return False
+    else:
+        try:
+            init_schema()
         except Exception as e:
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ❌ Fout bij database-opbouw: {e}")
+            log.error("❌ Fout bij controleren databaseschema: %s", e)
             return False
 
     return True
 
 
-# Bij import meteen controleren
-_DB_READY = _initialize_database()
-if not _DB_READY:
-    print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ⚠️  Database initialisatie mislukt. Data-extractie kan problemen geven.")
+# Pas controleren bij de eerste query (niet bij import), zodat modules die enkel
+# hulpfuncties zoals make_pivot gebruiken niet moeten wachten op een eventuele opbouw.
+_DB_READY: Optional[bool] = None
+# Zorgt ervoor dat gelijktijdige eerste queries (vanuit meerdere threads) de database maar één keer opbouwen
+_DB_LOCK = threading.Lock()
+
+
+def _ensure_database() -> bool:
+    """
+    Voert `_initialize_database` één keer per proces uit en onthoudt het resultaat.
+
+    Gelijktijdige eerste oproepen vanuit meerdere threads wachten op elkaar (double-checked locking),
+    zodat de database niet twee keer tegelijk uitgepakt en opgebouwd wordt.
+
+    Returns:
+        bool: True als de database klaar is voor gebruik.
+    """
+    global _DB_READY
+    if _DB_READY is None:
+        with _DB_LOCK:
+            if _DB_READY is None:
+                ready = _initialize_database()
+                if not ready:
+                    log.warning("⚠️  Database initialisatie mislukt. Data-extractie kan problemen geven.")
+                _DB_READY = ready
+    return _DB_READY
 
 
 # -------------------------------------------------------------------
 # 🧩 Hulpfuncties
 # -------------------------------------------------------------------
 
+def get_db_version() -> Tuple[Tuple[int, int], ...]:
+    """
+    Geeft een "versie" van de database terug op basis van de wijzigingstijd en grootte van het
+    databasebestand en het bijhorende WAL-bestand (waarin recente wijzigingen eerst terechtkomen).
+
+    Wordt gebruikt als sleutel voor de cache van de datafuncties: zodra de database bijgewerkt wordt,
+    verandert de versie en worden de gegevens opnieuw opgehaald.
+
+    Returns:
+        tuple: (mtime_ns, grootte) per bestaand bestand.
+    """
+    version = []
+    for path in (str(DB_FILE), f"{DB_FILE}-wal"):
+        try:
+            stat = os.stat(path)
+            version.append((stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            version.append((0, 0))
+    return tuple(version)
+
+
+# Aggregatiefuncties voor de totaalkolom in make_pivot die rechtstreeks met NumPy berekend worden.
+# De nan-varianten negeren ontbrekende waarden, net zoals de overeenkomstige pandas-functies (ddof=1 voor std/var).
+_NUMPY_AGGREGATES = {
+    "sum": np.nansum,
+    "mean": np.nanmean,
+    "median": np.nanmedian,
+    "min": np.nanmin,
+    "max": np.nanmax,
+    "std": functools.partial(np.nanstd, ddof=1),
+    "var": functools.partial(np.nanvar, ddof=1),
+}
+
+
+def _month_name_case(
+    lang: Optional[LangCode] = None,
+    short: bool = True,
+    column: str = "month"
+) -> Tuple[str, Tuple[Union[int, str], ...]]:
+    """
+    Interne hulpfunctie die een SQL CASE-expressie opbouwt om maandnummers in de query
+    zelf te vertalen naar maandnamen (kolom 'month_name').
+
+    De maandnamen worden als parameters meegegeven (geen string-interpolatie van vertalingen in de SQL).
+    Het resultaat begint met een komma, zodat het rechtstreeks achter de laatste SELECT-kolom geplakt kan worden.
+
+    Args:
+        lang (LangCode | None): 'nl', 'fr' of 'en'. Bij None wordt geen maandnaam toegevoegd.
+        short (bool): korte of volledige maandnaam.
+        column (str): naam van de kolom met het maandnummer.
+
+    Returns:
+        tuple[str, tuple]: Het SQL-fragment (inclusief alias) en de bijhorende parameters,
+                           of een leeg fragment zonder parameters als `lang` None is.
+    """
+    if lang is None:
+        return "", ()
+    whens = " ".join("WHEN ? THEN ?" for _ in range(12))
+    params = tuple(
+        value
+        for m in range(1, 13)
+        for value in (m, get_month_name(m, lang, short))
+    )
+    return f", CASE {column} {whens} END AS month_name", params
+
+
 def make_pivot(
     df: pd.DataFrame,
     index_cols: Union[str, List[str]],
@@ -99,10 +205,13 @@ def make_pivot(
         - De pivot zelf ondersteunt alle standaard Pandas-aggregatiefuncties.
         - Voor de extra total-kolom worden enkel aggregatiefuncties ondersteund
           waarvoor `pivot.<aggfunc>()` bestaat. Bij een ongeldige functie wordt
-          een waarschuwing geprint en een lege DataFrame teruggegeven.
+          een fout gelogd en een lege DataFrame teruggegeven.
+
+    Bevat de DataFrame al een kolom 'month_name' (vertaald in de SQL-query), dan worden
+    die namen gebruikt en moeten ze niet opnieuw opgezocht worden.
 
     Args:
-        df (pd.DataFrame): Input DataFrame met kolom 'month'.
+        df (pd.DataFrame): Input DataFrame met kolom 'month' (en optioneel 'month_name').
         index_cols (str | list[str]): Kolom of lijst van kolommen voor de rijen.
         value_col (str): Waardekolom.
         aggfunc (str): Aggregatiefunctie voor de pivot én voor de extra kolom.
@@ -118,16 +227,20 @@ def make_pivot(
         pd.DataFrame: Geaggregeerde pivot-tabel met maandnamen als kolommen,
                       eventueel aangevuld met een extra kolom die de totale waarde bevat volgens `aggfunc`.
     """
-    pivot = df.pivot_table(
-        index=index_cols,
-        columns="month",
-        values=value_col,
-        aggfunc=aggfunc,
-        fill_value=fill_value
+    # groupby + unstack i.p.v. pivot_table: zelfde resultaat, zonder de extra controles en margins-logica
+    idx = [index_cols] if isinstance(index_cols, str) else list(index_cols)
+    pivot = (
+        df.groupby([*idx, "month"], observed=True, sort=True)[value_col]
+          .agg(aggfunc)
+          .unstack("month", fill_value=fill_value)
     )
-    
+
     # Kolomnamen omzetten naar maandnamen
-    pivot.columns = [get_month_name(m, lang=lang, short=short) for m in pivot.columns]
+    if "month_name" in df.columns:
+        month_names = dict(zip(df["month"], df["month_name"]))
+        pivot.columns = [month_names[m] for m in pivot.columns]
+    else:
+        pivot.columns = [get_month_name(m, lang, short) for m in pivot.columns]
 
     # Indexnaam vertalen indien het een enkele kolom is
     if isinstance(index_cols, str) and index_cols.lower() == "year":
@@ -137,22 +250,169 @@ def make_pivot(
     if include_totals:
         # Check of de DataFrame deze aggregatie ondersteunt
         if not hasattr(pivot, aggfunc):
-            print(f"\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ❌ '{aggfunc}' wordt niet ondersteund.")
+            log.error("❌ '%s' wordt niet ondersteund.", aggfunc)
             return pd.DataFrame()   # lege dataframe
 
-        pivot[TRANSLATIONS["year"][lang]] = pivot.aggregate(aggfunc, axis=1)
+        # Rechtstreeks op de NumPy-array rekenen voor de gangbare functies (NaN-waarden worden genegeerd,
+        # net zoals bij pandas); andere functies via pandas zelf
+        numpy_func = _NUMPY_AGGREGATES.get(aggfunc)
+        if numpy_func is not None:
+            with warnings.catch_warnings():
+                # Rijen met enkel NaN geven NaN als resultaat; de RuntimeWarning daarover is overbodig
+                warnings.simplefilter("ignore", category=RuntimeWarning)
+                totals = numpy_func(pivot.to_numpy(), axis=1)
+        else:
+            totals = pivot.aggregate(aggfunc, axis=1)
+        pivot[TRANSLATIONS["year"][lang]] = totals
 
     return pivot
 
 
-def execute_query(query: str, db_file: str = DB_FILE) -> pd.DataFrame:
+# Persistente leesconnecties per thread en per databasebestand.
+# Een connectie wordt één keer geopend en daarna hergebruikt, zodat herhaalde queries
+# de (warme) page cache van SQLite benutten in plaats van telkens opnieuw te verbinden.
+# De connecties zitten in een threading.local(): elke thread krijgt een eigen connectie
+# die samen met de thread opgeruimd wordt. Dankzij WAL (ingesteld door de schrijver in
+# `database_tools`) kunnen meerdere lezers parallel queries uitvoeren.
+_LOCAL = threading.local()
+
+
+def _get_conn(db_file: str = DB_FILE) -> sqlite3.Connection:
+    """
+    Geeft een persistente SQLite-connectie terug voor het opgegeven databasebestand,
+    eigen aan de huidige thread (veilig te gebruiken vanuit bv. een ThreadPoolExecutor).
+
+    Bij de eerste aanroep wordt de connectie geopend en worden enkel PRAGMA's ingesteld
+    die per connectie gelden (de journal mode is een eigenschap van het databasebestand
+    en wordt door de schrijver ingesteld):
+        - temp_store=MEMORY: tijdelijke tabellen (bv. voor GROUP BY/ORDER BY) in het geheugen.
+        - cache_size=-65536: page cache van ongeveer 64 MB.
+        - mmap_size=268435456: tot 256 MB van het bestand wordt via memory-mapped I/O gelezen,
+          zodat pagina's niet telkens via een read-systeemaanroep gekopieerd worden.
+
+    Args:
+        db_file (str, optional): Pad naar het SQLite-databasebestand. Standaard `DB_FILE`.
+
+    Returns:
+        sqlite3.Connection: De (hergebruikte) connectie.
+    """
+    connections: Optional[Dict[str, sqlite3.Connection]] = getattr(_LOCAL, "connections", None)
+    if connections is None:
+        connections = _LOCAL.connections = {}
+    key = str(db_file)
+    conn = connections.get(key)
+    if conn is None:
+        conn = sqlite3.connect(key, isolation_level=None)
+        conn.executescript("""
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-65536;
+            PRAGMA mmap_size=268435456;
+        """)
+        connections[key] = conn
+    return conn
+
+
+# Gekende kolommen uit de datafuncties met hun vaste datatype.
+# Deze kolommen worden rechtstreeks in het juiste type opgebouwd, zonder dat pandas het type per kolom moet raden.
+_COLUMN_DTYPES: Dict[str, str] = {
+    "year": "int64",
+    "month": "int64",
+    "weekday": "int64",
+    "hour": "int64",
+    "count_neg": "int64",
+    "total_GWh": "float64",
+    "avg_price": "float64",
+    "wind_GWh": "float64",
+    "solar_GWh": "float64",
+    "belpex_EUR_per_MWh": "float64",
+    "price_eur_per_MWh": "float64",
+    "measured_wind_MW": "float64",
+    "measured_solar_MW": "float64",
+}
+
+
+@atexit.register
+def _close_connections() -> None:
+    """
+    Sluit de persistente connecties van de huidige thread (bij het afsluiten van Python:
+    de hoofdthread). Connecties van andere threads worden samen met hun thread opgeruimd.
+    """
+    connections = getattr(_LOCAL, "connections", {})
+    for conn in connections.values():
+        conn.close()
+    connections.clear()
+
+
+def _rows_to_frame(columns: List[str], rows: List[tuple]) -> pd.DataFrame:
+    """
+    Interne hulpfunctie die opgehaalde rijen kolomsgewijs omzet naar een DataFrame.
+
+    Gekende kolommen (zie `_COLUMN_DTYPES`) worden meteen in het juiste type opgebouwd,
+    de rest via pandas' eigen type-inferentie.
+
+    Args:
+        columns (list[str]): kolomnamen uit `cursor.description`.
+        rows (list[tuple]): de opgehaalde rijen.
+
+    Returns:
+        pd.DataFrame: DataFrame met de opgegeven kolommen.
+    """
+    data = {}
+    for name, values in zip(columns, zip(*rows)):
+        dtype = _COLUMN_DTYPES.get(name)
+        try:
+            data[name] = np.array(values, dtype=dtype) if dtype else pd.Series(values).array
+        except (TypeError, ValueError):
+            # Bv. NULL-waarden in een integerkolom: laat pandas het type bepalen
+            data[name] = pd.Series(values).array
+    df = pd.DataFrame(data, columns=columns)
+    if not rows:
+        df = df.astype({name: _COLUMN_DTYPES[name] for name in columns if name in _COLUMN_DTYPES})
+    return df
+
+
+def _iter_query(
+    cursor: sqlite3.Cursor,
+    chunksize: int
+) -> Iterator[pd.DataFrame]:
+    """
+    Interne generator die het resultaat van een uitgevoerde query in blokken van `chunksize` rijen teruggeeft.
+
+    Fouten tijdens het ophalen worden niet opgevangen maar doorgegeven aan de aanroeper: zo kan die een
+    afgebroken iteratie onderscheiden van een volledig resultaat (en niet verder rekenen met een deel van de data).
+
+    Args:
+        cursor (sqlite3.Cursor): cursor waarop de query al uitgevoerd werd.
+        chunksize (int): maximaal aantal rijen per blok.
+
+    Yields:
+        pd.DataFrame: opeenvolgende deel-DataFrames.
+    """
+    columns = [description[0] for description in cursor.description]
+    try:
+        while True:
+            rows = cursor.fetchmany(chunksize)
+            if not rows:
+                break
+            yield _rows_to_frame(columns, rows)
+    finally:
+        cursor.close()
+
+
+def execute_query(
+    query: str,
+    db_file: str = DB_FILE,
+    params: Sequence = (),
+    chunksize: Optional[int] = None
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame], None]:
     """
     Voert een SQL-query uit op de opgegeven SQLite-database en retourneert het resultaat als DataFrame.
 
     Deze functie wordt gebruikt als generieke helper voor het uitvoeren van leesqueries
     in alle datafuncties (zoals wind-, zonne- en Belpex-data). 
-    De functie maakt automatisch een verbinding met de database, voert de query uit,
-    sluit de connectie en logt eventuele fouten via console-uitvoer.
+    De functie gebruikt een persistente verbinding met de database (zie `_get_conn`),
+    voert de query uit en logt eventuele fouten via console-uitvoer.
+    Bij de eerste aanroep wordt gecontroleerd of de database bestaat en wordt ze zo nodig opgebouwd.
 
     Args:
         query (str): 
@@ -160,49 +420,76 @@ def execute_query(query: str, db_file: str = DB_FILE) -> pd.DataFrame:
         db_file (str, optional): 
             Pad naar het SQLite-databasebestand. 
             Standaard wordt `DB_FILE` gebruikt.
+        params (Sequence, optional):
+            Parameters voor de placeholders (`?`) in de query.
+        chunksize (int, optional):
+            Indien opgegeven wordt een iterator van DataFrames met telkens maximaal `chunksize` rijen
+            teruggegeven, zodat grote resultaten niet volledig in het geheugen moeten staan.
+            Fouten tijdens het itereren worden dan doorgegeven aan de aanroeper (zie `_iter_query`).
 
     Returns:
-        pd.DataFrame: 
-            Een DataFrame met het resultaat van de query. 
+        pd.DataFrame | Iterator[pd.DataFrame]: 
+            Een DataFrame met het resultaat van de query (of een iterator bij `chunksize`). 
             Indien de query mislukt, wordt None geretourneerd.
 
     Raises:
         KeyboardInterrupt: 
             Wanneer de gebruiker het script handmatig onderbreekt (Ctrl+C).
     """
+    if str(db_file) == str(DB_FILE):
+        _ensure_database()
+
     try:
-        with sqlite3.connect(db_file) as conn:
-            return pd.read_sql_query(query, conn)
+        if chunksize:
+            # Eigen cursor, zodat andere queries op dezelfde connectie de iteratie niet verstoren
+            cursor = _get_conn(db_file).cursor()
+            cursor.execute(query, params)
+            return _iter_query(cursor, chunksize)
+
+        cursor = _get_conn(db_file).execute(query, params)
+        columns = [description[0] for description in cursor.description]
+        return _rows_to_frame(columns, cursor.fetchall())
     except KeyboardInterrupt:
-        print(f"\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - 🛑 Script onderbroken door gebruiker.")
+        log.warning("🛑 Script onderbroken door gebruiker.")
     except Exception as e:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ❌ Onverwachte fout: {e}")
+        log.error("❌ Onverwachte fout: %s", e)
 
 
 # -------------------------------------------------------------------
 # 🌬️ WINDENERGIE
 # -------------------------------------------------------------------
 
-def get_wind_dataframe_split() -> pd.DataFrame:
+@cache_per_version(get_db_version)
+def get_wind_dataframe_split(
+    lang: Optional[LangCode] = None,
+    short: bool = True
+) -> pd.DataFrame:
     """
     Haalt de maandelijkse windproductie op, opgesplitst in offshore en onshore.
 
-    De data worden uit de database geladen, omgerekend van kwartierwaarden naar
-    GWh per maand, en per type wind (offshore/onshore) geaggregeerd.
+    De data worden geladen uit de maandtotalen in de database (`tbl_wind_monthly`),
+    die bij het bijwerken al omgerekend zijn van kwartierwaarden naar GWh per maand
+    en per type wind (offshore/onshore) geaggregeerd.
+
+    Args:
+        lang (LangCode | None): Indien opgegeven wordt een kolom 'month_name' toegevoegd met de
+                                maandnaam in deze taal ('nl', 'fr' of 'en'), vertaald in de query zelf.
+        short (bool): gebruik korte maandnamen (True) of volledige (False) voor 'month_name'.
 
     Returns:
-        pd.DataFrame: met kolommen ['offshoreonshore', 'year', 'month', 'total_GWh']
+        pd.DataFrame: met kolommen ['offshoreonshore', 'year', 'month', 'total_GWh'] (+ 'month_name')
                       waarbij elke rij één maand voor één type (offshore/onshore) voorstelt.
     """
-    query = """
-        SELECT offshoreonshore, year, month, SUM(measured)/4/1000.0 AS total_GWh
-        FROM tbl_wind_data
-        GROUP BY offshoreonshore, year, month
+    month_name_sql, params = _month_name_case(lang, short)
+    query = f"""
+        SELECT offshoreonshore, year, month, total_GWh{month_name_sql}
+        FROM tbl_wind_monthly
         ORDER BY offshoreonshore, year, month
     """
-    return execute_query(query)
+    return execute_query(query, params=params)
 
 
+@cache_per_version(get_db_version)
 def get_wind_pivot_split(
     lang: LangCode = "nl",
     short: bool = True,
@@ -227,7 +514,7 @@ def get_wind_pivot_split(
         pd.DataFrame: pivot-tabel met windproductie in GWh per maand,
                       eventueel aangevuld met een 'Totaal'-kolom.
     """
-    df = get_wind_dataframe_split()
+    df = get_wind_dataframe_split(lang=lang, short=short)
     return make_pivot(
         df,
         index_cols=["offshoreonshore", "year"],
@@ -239,25 +526,36 @@ def get_wind_pivot_split(
     )
 
 
-def get_wind_dataframe_total() -> pd.DataFrame:
+@cache_per_version(get_db_version)
+def get_wind_dataframe_total(
+    lang: Optional[LangCode] = None,
+    short: bool = True
+) -> pd.DataFrame:
     """
     Haalt de totale maandelijkse windproductie (onshore + offshore) op uit de database.
 
-    De data worden omgerekend naar GWh en geaggregeerd per jaar en maand.
+    De maandtotalen (`tbl_wind_monthly`, in GWh) worden opgeteld per jaar en maand.
+
+    Args:
+        lang (LangCode | None): Indien opgegeven wordt een kolom 'month_name' toegevoegd met de
+                                maandnaam in deze taal ('nl', 'fr' of 'en'), vertaald in de query zelf.
+        short (bool): gebruik korte maandnamen (True) of volledige (False) voor 'month_name'.
 
     Returns:
-        pd.DataFrame: met kolommen ['year', 'month', 'total_GWh']
+        pd.DataFrame: met kolommen ['year', 'month', 'total_GWh'] (+ 'month_name')
                       waarbij elke rij één maandelijkse totaalwaarde voorstelt.
     """
-    query = """
-        SELECT year, month, SUM(measured)/4/1000.0 AS total_GWh
-        FROM tbl_wind_data
+    month_name_sql, params = _month_name_case(lang, short)
+    query = f"""
+        SELECT year, month, SUM(total_GWh) AS total_GWh{month_name_sql}
+        FROM tbl_wind_monthly
         GROUP BY year, month
         ORDER BY year, month
     """
-    return execute_query(query)
+    return execute_query(query, params=params)
 
 
+@cache_per_version(get_db_version)
 def get_wind_pivot_total(
     lang: LangCode = "nl",
     short: bool = True,
@@ -281,7 +579,7 @@ def get_wind_pivot_total(
         pd.DataFrame: pivot-tabel met totale windproductie (GWh) per maand,
                       eventueel aangevuld met een 'Totaal'-kolom.
     """
-    df = get_wind_dataframe_total()
+    df = get_wind_dataframe_total(lang=lang, short=short)
     return make_pivot(
         df,
         index_cols="year",
@@ -297,23 +595,33 @@ def get_wind_pivot_total(
 # ☀️ ZONNE-ENERGIE
 # -------------------------------------------------------------------
 
-def get_solar_dataframe() -> pd.DataFrame:
+@cache_per_version(get_db_version)
+def get_solar_dataframe(
+    lang: Optional[LangCode] = None,
+    short: bool = True
+) -> pd.DataFrame:
     """
-    Haalt maandelijkse zonne-energieproductie op uit de database.
+    Haalt maandelijkse zonne-energieproductie op uit de database (`tbl_solar_monthly`).
     Omgezet naar GWh, zonder pivotering.
 
+    Args:
+        lang (LangCode | None): Indien opgegeven wordt een kolom 'month_name' toegevoegd met de
+                                maandnaam in deze taal ('nl', 'fr' of 'en'), vertaald in de query zelf.
+        short (bool): gebruik korte maandnamen (True) of volledige (False) voor 'month_name'.
+
     Returns:
-        pd.DataFrame: Kolommen = ['year', 'month', 'total_GWh']
+        pd.DataFrame: Kolommen = ['year', 'month', 'total_GWh'] (+ 'month_name')
     """
-    query = """
-        SELECT year, month, SUM(measured)/4/1000.0 AS total_GWh
-        FROM tbl_solar_data
-        GROUP BY year, month
+    month_name_sql, params = _month_name_case(lang, short)
+    query = f"""
+        SELECT year, month, total_GWh{month_name_sql}
+        FROM tbl_solar_monthly
         ORDER BY year, month
     """
-    return execute_query(query)
+    return execute_query(query, params=params)
 
 
+@cache_per_version(get_db_version)
 def get_solar_pivot(
     lang: LangCode = "nl",
     short: bool = True,
@@ -337,7 +645,7 @@ def get_solar_pivot(
         pd.DataFrame: pivot-tabel met zonne-energieproductie (GWh) per maand,
                       eventueel aangevuld met een 'Totaal'-kolom.
     """
-    df = get_solar_dataframe()
+    df = get_solar_dataframe(lang=lang, short=short)
     return make_pivot(
         df,
         index_cols="year",
@@ -353,22 +661,32 @@ def get_solar_pivot(
 # ⚡ BELPEX-PRIJZEN (maandbasis)
 # -------------------------------------------------------------------
 
-def get_belpex_dataframe() -> pd.DataFrame:
+@cache_per_version(get_db_version)
+def get_belpex_dataframe(
+    lang: Optional[LangCode] = None,
+    short: bool = True
+) -> pd.DataFrame:
     """
-    Haalt maandelijkse Belpex-spotprijzen op uit de database.
+    Haalt maandelijkse Belpex-spotprijzen op uit de database (`tbl_belpex_monthly`).
+
+    Args:
+        lang (LangCode | None): Indien opgegeven wordt een kolom 'month_name' toegevoegd met de
+                                maandnaam in deze taal ('nl', 'fr' of 'en'), vertaald in de query zelf.
+        short (bool): gebruik korte maandnamen (True) of volledige (False) voor 'month_name'.
 
     Returns:
-        pd.DataFrame: Kolommen = ['year', 'month', 'avg_price']
+        pd.DataFrame: Kolommen = ['year', 'month', 'avg_price'] (+ 'month_name')
     """
-    query = """
-        SELECT year, month, AVG(price_eur_per_MWh) AS avg_price
-        FROM tbl_belpex_prices
-        GROUP BY year, month
+    month_name_sql, params = _month_name_case(lang, short)
+    query = f"""
+        SELECT year, month, avg_price{month_name_sql}
+        FROM tbl_belpex_monthly
         ORDER BY year, month
     """
-    return execute_query(query)
+    return execute_query(query, params=params)
 
 
+@cache_per_version(get_db_version)
 def get_belpex_pivot(
     lang: LangCode = "nl",
     short: bool = True,
@@ -392,7 +710,7 @@ def get_belpex_pivot(
         pd.DataFrame: pivot-tabel met Belpex-prijzen per maand,
                       eventueel aangevuld met een 'Totaal'-kolom.
     """
-    df = get_belpex_dataframe()
+    df = get_belpex_dataframe(lang=lang, short=short)
     return make_pivot(
         df,
         index_cols="year",
@@ -408,6 +726,7 @@ def get_belpex_pivot(
 # ⚡ BELPEX-PRIJZEN (uurbasis)
 # -------------------------------------------------------------------
 
+@cache_per_version(get_db_version)
 def get_belpex_hourly_dataframe() -> pd.DataFrame:
     query = """
         SELECT 
@@ -422,6 +741,58 @@ def get_belpex_hourly_dataframe() -> pd.DataFrame:
     return execute_query(query)
 
 
+@cache_per_version(get_db_version)
+def get_belpex_raw_dataframe() -> pd.DataFrame:
+    """
+    Haalt alle uurprijzen van Belpex op (niet geaggregeerd).
+
+    Het resultaat wordt bewaard zolang de database niet wijzigt, zodat verschillende
+    overzichten (bv. negatieve prijzen en de prijsverdeling per maand) dezelfde
+    ingelezen data kunnen hergebruiken.
+
+    Returns:
+        pd.DataFrame: Kolommen = ['year', 'month', 'price_eur_per_MWh']
+    """
+    query = """
+        SELECT year, month, price_eur_per_MWh
+        FROM tbl_belpex_prices
+    """
+    return execute_query(query)
+
+
+@cache_per_version(get_db_version)
+def _get_belpex_hourly_numeric_pivot(
+    group_by: Literal["weekday", "month"]
+) -> Optional[pd.DataFrame]:
+    """
+    Interne hulpfunctie die de gemiddelde uurprijzen pivoteert op uur en weekdag- of maandnummer.
+
+    Het resultaat is taalonafhankelijk en wordt bewaard zolang de database niet wijzigt;
+    bij het wisselen van taal of notatie worden enkel de kolomlabels opnieuw ingesteld.
+
+    Args:
+        group_by (Literal["weekday", "month"]): kolom waarop gegroepeerd wordt.
+
+    Returns:
+        pd.DataFrame | None: rijen = uren, kolommen = weekdag- of maandnummers,
+                             of None als er geen data is.
+    """
+    df = get_belpex_hourly_dataframe()
+
+    if df is None or df.empty:
+        return None
+
+    # Enkel waargenomen combinaties, geen volledig cartesisch product
+    return df.pivot_table(
+        index="hour",
+        columns=group_by,
+        values="avg_price",
+        aggfunc="mean",
+        fill_value=0,
+        observed=True
+    )
+
+
 def get_belpex_hourly_pivot(
     group_by: Literal["weekday", "month"] = "weekday",
     lang: LangCode = "nl",
@@ -446,41 +817,33 @@ def get_belpex_hourly_pivot(
             - kolommen = weekdagen of maanden
             - waarden = gemiddelde prijs (EUR/MWh)
     """
-    # Data ophalen
-    df = get_belpex_hourly_dataframe()
-
-    if df is None or df.empty:
-        print("⚠️ Geen resultaten gevonden voor Belpex-prijzen per uur.")
-        return pd.DataFrame()
-
-    # Namen toevoegen volgens gekozen groepering
+    # Namen opzoeken volgens gekozen groepering
+    # Slechts 7 weekdagen of 12 maanden: de labels worden enkel op de kolommen gezet, niet per rij
     if group_by == "weekday":
-        df["label"] = df["weekday"].apply(lambda w: get_weekday_name(w, lang=lang, short=short))
-        ordered_labels = [get_weekday_name(i, lang=lang, short=short) for i in range(1,8)]
+        lookup = {i: get_weekday_name(i, lang, short) for i in range(1, 8)}
         column_label = TRANSLATIONS["weekday"][lang]
     elif group_by == "month":
-        df["label"] = df["month"].apply(lambda m: get_month_name(m, lang=lang, short=short))
-        ordered_labels = [get_month_name(i, lang=lang, short=short) for i in range(1, 13)]
+        lookup = {i: get_month_name(i, lang, short) for i in range(1, 13)}
         column_label = TRANSLATIONS["month"][lang]
     else:
         raise ValueError("❌ Ongeldige waarde voor 'group_by'. Gebruik 'weekday' of 'month'.")
+    ordered_labels = list(lookup.values())
 
-    # Correcte volgorde behouden (niet alfabetisch)
-    df["label"] = pd.Categorical(df["label"], categories=ordered_labels, ordered=True)
+    # Taalonafhankelijke pivot ophalen (bewaard zolang de database niet wijzigt)
+    pivot = _get_belpex_hourly_numeric_pivot(group_by)
 
-    # Pivot-tabel bouwen
-    pivot = df.pivot_table(
-        index="hour",
-        columns="label",
-        values="avg_price",
-        aggfunc="mean",
-        fill_value=0,
-        observed=False  # ✅ voorkomt FutureWarning
-    )
+    if pivot is None or pivot.empty:
+        log.warning("⚠️ Geen resultaten gevonden voor Belpex-prijzen per uur.")
+        return pd.DataFrame()
+
+    # Alle weekdagen/maanden in de juiste volgorde (niet alfabetisch), ontbrekende groepen aanvullen
+    pivot = pivot.reindex(columns=list(lookup), fill_value=0)
 
-    # Index- en kolomnamen instellen voor nette output
+    # Index- en kolomnamen instellen voor nette output (kolommen blijven een geordende categorie)
     pivot.index.name = TRANSLATIONS["hour"][lang]
-    pivot.columns.name = column_label
+    pivot.columns = pd.CategoricalIndex(
+        ordered_labels, categories=ordered_labels, ordered=True, name=column_label
+    )
 
     return pivot
 
@@ -489,12 +852,63 @@ def get_belpex_hourly_pivot(
 # 🔗 GECOMBINEERDE DATA (Wind + Zon + Belpex)
 # -------------------------------------------------------------------
 
+@cache_per_version(get_db_version)
+def _get_combined_monthly(
+    lang: LangCode = "nl",
+    short: bool = True
+) -> pd.DataFrame:
+    """
+    Interne hulpfunctie die de maandtotalen van wind, zon en Belpex in één SQL-query samenvoegt.
+
+    SQLite kende lange tijd geen FULL OUTER JOIN; die wordt hier nagebootst door eerst alle
+    (jaar, maand)-combinaties uit de drie bronnen te verzamelen (UNION) en daarop telkens
+    een LEFT JOIN te doen. Zo blijven ook maanden behouden die maar in één bron voorkomen.
+
+    Args:
+        lang (LangCode): Taalcode voor de maandnamen ('nl', 'fr' of 'en').
+        short (bool): Gebruik korte (True) of volledige (False) maandnamen.
+
+    Returns:
+        pd.DataFrame: Kolommen = ['year', 'month', 'wind_GWh', 'solar_GWh', 'belpex_EUR_per_MWh', 'month_name'],
+                      chronologisch gesorteerd.
+    """
+    month_name_sql, params = _month_name_case(lang, short, column="k.month")
+    query = f"""
+        WITH
+            w AS (
+                SELECT year, month, SUM(total_GWh) AS wind_GWh
+                FROM tbl_wind_monthly
+                GROUP BY year, month
+            ),
+            s AS (
+                SELECT year, month, total_GWh AS solar_GWh
+                FROM tbl_solar_monthly
+            ),
+            b AS (
+                SELECT year, month, avg_price AS belpex_EUR_per_MWh
+                FROM tbl_belpex_monthly
+            ),
+            k AS (
+                SELECT year, month FROM w
+                UNION SELECT year, month FROM s
+                UNION SELECT year, month FROM b
+            )
+        SELECT k.year, k.month, w.wind_GWh, s.solar_GWh, b.belpex_EUR_per_MWh{month_name_sql}
+        FROM k
+            LEFT JOIN w ON w.year = k.year AND w.month = k.month
+            LEFT JOIN s ON s.year = k.year AND s.month = k.month
+            LEFT JOIN b ON b.year = k.year AND b.month = k.month
+        ORDER BY k.year, k.month
+    """
+    return execute_query(query, params=params)
+
+
 def get_combined_dataframe(fillna: bool = False, lang: LangCode = "nl", short: bool = True) -> pd.DataFrame:
     """
     Combineert wind-, zonne-energie- en Belpex-data in één DataFrame.
 
-    Haalt maandelijkse waarden op uit de database, hernoemt kolommen voor
-    consistentie en voegt alles samen op jaar en maand. Verrijkt de dataset
+    Haalt maandelijkse waarden op uit de database en voegt alles samen op jaar
+    en maand (in één SQL-query, zie `_get_combined_monthly`). Verrijkt de dataset
     met een periodekolom ('period', formaat YYYY-MM) en een maandnaamkolom
     ('month_name') in de gewenste taal en notatie.
 
@@ -514,40 +928,24 @@ def get_combined_dataframe(fillna: bool = False, lang: LangCode = "nl", short: b
             ['year', 'month', 'wind_GWh', 'solar_GWh', 
              'belpex_EUR_per_MWh', 'period', 'month_name']
     """
-    # Data ophalen
-    df_wind = get_wind_dataframe_total()
-    df_solar = get_solar_dataframe()
-    df_belpex = get_belpex_dataframe()
-
-    # Kolomnamen hernoemen voor duidelijkheid
-    df_wind = df_wind.rename(columns={'total_GWh': 'wind_GWh'})
-    df_solar = df_solar.rename(columns={'total_GWh': 'solar_GWh'})
-    df_belpex = df_belpex.rename(columns={'avg_price': 'belpex_EUR_per_MWh'})
-
-    # Datasets samenvoegen op jaar en maand
-    df_compare = (
-        df_wind.merge(df_solar, on=['year', 'month'], how='outer')
-               .merge(df_belpex, on=['year', 'month'], how='outer')
-    )
+    # Data ophalen: wind, zon en Belpex in één query samengevoegd (maandnamen al vertaald in de query)
+    df_compare = _get_combined_monthly(lang=lang, short=short)
 
-    # Chronologische volgorde garanderen
-    df_compare = df_compare.sort_values(["year", "month"])
+    # De query levert de rijen al chronologisch gesorteerd aan (ORDER BY year, month): geen extra sortering nodig
 
-    # Periode-label toevoegen (YYYY-MM)
-    df_compare["period"] = (
-        df_compare["year"].astype(str)
-        + "-"
-        + df_compare["month"].astype(str).str.zfill(2)
-    )
+    # Periode-label toevoegen (YYYY-MM), in één bewerking op de integerkolommen
+    df_compare["period"] = pd.PeriodIndex.from_fields(
+        year=df_compare["year"], month=df_compare["month"], freq="M"
+    ).astype(str)
 
-    # Maandnamen toevoegen
-    df_compare["month_name"] = df_compare["month"].apply(
-        lambda m: get_month_name(m, lang=lang, short=short)
-    )
+    # Maandnaam achteraan plaatsen
+    df_compare["month_name"] = df_compare.pop("month_name")
 
     # Ontbrekende waarden vervangen indien gevraagd
     if fillna:
-        df_compare = df_compare.fillna(0)
+        # Enkel de meetkolommen kunnen ontbreken (LEFT JOIN); de rest van het frame niet kopiëren
+        num_cols = ["wind_GWh", "solar_GWh", "belpex_EUR_per_MWh"]
+        df_compare[num_cols] = df_compare[num_cols].fillna(0)
 
     return df_compare
 
@@ -556,6 +954,7 @@ def get_combined_dataframe(fillna: bool = False, lang: LangCode = "nl", short: b
 # 📉 BELPEX – NEGATIEVE PRIJZEN
 # -------------------------------------------------------------------
 
+@cache_per_version(get_db_version)
 def get_negative_price_counts_pivot(
     lang: LangCode = "nl",
     short: bool = True,
@@ -579,21 +978,31 @@ def get_negative_price_counts_pivot(
     Returns:
         pd.DataFrame: pivot-tabel met kolommen = maandnamen (+ 'Totaal' indien gevraagd)
     """
-    query = """
-        SELECT 
-            year,
-            month,
-            COUNT(price_belpex_MWh) AS count_neg
-        FROM v_belpex
-        WHERE price_belpex_MWh < 0
-        GROUP BY year, month
-        ORDER BY year, month
-    """
+    raw = get_belpex_raw_dataframe()
 
-    df = execute_query(query)
+    if raw is None or raw.empty:
+        log.warning("⚠️ Geen resultaten gevonden voor negatieve prijzen.")
+        return pd.DataFrame()
 
-    if df is None or df.empty:
-        print("⚠️ Geen resultaten gevonden voor negatieve prijzen.")
+    # Tellen per (jaar, maand) met één np.bincount over een platte index i.p.v. een SQL GROUP BY
+    years = raw["year"].to_numpy()
+    months = raw["month"].to_numpy()
+    negative = raw["price_eur_per_MWh"].to_numpy() < 0
+    year_min = int(years.min())
+    n_years = int(years.max()) - year_min + 1
+    flat = (years - year_min) * 12 + (months - 1)
+    counts = np.bincount(flat[negative], minlength=n_years * 12)
+
+    # Enkel (jaar, maand)-combinaties met minstens één negatieve prijs behouden
+    nonzero = np.flatnonzero(counts)
+    df = pd.DataFrame({
+        "year": year_min + nonzero // 12,
+        "month": nonzero % 12 + 1,
+        "count_neg": counts[nonzero],
+    })
+
+    if df.empty:
+        log.warning("⚠️ Geen resultaten gevonden voor negatieve prijzen.")
         return pd.DataFrame()
 
     # Pivot: jaren als rijen, maanden als kolommen
@@ -622,12 +1031,42 @@ def get_negative_price_counts_pivot(
 # 🌍 PIEK HERNIEUWBARE PRODUCTIE (Wind + Zon)
 # -------------------------------------------------------------------
 
+def _peak_per_year(
+    years: np.ndarray,
+    values: np.ndarray
+) -> np.ndarray:
+    """
+    Bepaalt in één doorloop de posities van de hoogste waarde per jaar.
+
+    Verwacht dat de invoer gesorteerd is op jaar. Per aaneengesloten jaarblok wordt het maximum
+    bepaald (NaN-waarden worden genegeerd); gelijke maxima blijven allemaal behouden, net als bij
+    RANK() = 1 in SQL.
+
+    Args:
+        years (np.ndarray): jaartallen, gesorteerd
+        values (np.ndarray): waarden per rij
+
+    Returns:
+        np.ndarray: indices van de piekrijen, in oplopende volgorde
+    """
+    if len(years) == 0:
+        return np.empty(0, dtype=np.intp)
+
+    starts = np.flatnonzero(np.r_[True, years[1:] != years[:-1]])
+    counts = np.diff(np.r_[starts, len(years)])
+    maxima = np.fmax.reduceat(values, starts)
+
+    return np.flatnonzero(values == np.repeat(maxima, counts))
+
+
 def get_peak_renewable_production(lang: LangCode = "nl") -> pd.DataFrame:
     """
     Haalt de jaarlijkse piekproductie van hernieuwbare energie (wind + zon) op uit de database.
 
-    De query combineert wind- en zonneproductie per kwartier, berekent de som per timestamp
-    en bepaalt via een windowfunctie (RANK) het hoogste productiemoment per jaar.
+    De query combineert wind- en zonneproductie per kwartier; de som per timestamp en het
+    hoogste productiemoment per jaar worden daarna in één lineaire doorloop met NumPy bepaald,
+    in plaats van via een windowfunctie (RANK) die elk jaar volledig moet sorteren.
+    De rijen worden in blokken opgehaald, zodat het geheugengebruik beperkt blijft.
     Het resultaat bevat voor elk jaar de datum, het tijdstip en het piekvermogen in MW.
 
     De kolomnamen worden vertaald naar de opgegeven taal.
@@ -641,37 +1080,51 @@ def get_peak_renewable_production(lang: LangCode = "nl") -> pd.DataFrame:
     """
     query = """
         SELECT
-            DATE(datetime) AS date,
-            TIME(datetime) AS time,
-            Renewable_MW AS "renewable_peak"
-        FROM(
-            SELECT
-                w.year,
-                w.datetime,
-                CAST((w.measured_wind_MW + s.measured_solar_MW) AS INTEGER) AS Renewable_MW,
-                RANK() OVER (
-                    PARTITION BY w.year 
-                    ORDER BY (w.measured_wind_MW + s.measured_solar_MW) DESC
-                ) AS volgorde
-            FROM 
-                v_solar s
-                LEFT JOIN v_wind w ON s.datetime = w.datetime
-            ORDER BY Renewable_MW DESC
-        )
-        WHERE volgorde = 1
-        ORDER BY year
-    """
-
-    df = execute_query(query)
+            w.year,
+            s.datetime,
+            w.measured_wind_MW,
+            s.measured_solar_MW
+        FROM 
+            v_solar s
+            JOIN v_wind w ON s.datetime = w.datetime
+        ORDER BY w.year, s.datetime
+    """
 
-    if df is None or df.empty:
-        print("⚠️ Geen resultaten gevonden voor piekproductie hernieuwbaar.")
+    # Per blok van 50.000 kwartieren verwerken en het maximum per jaar incrementeel bijhouden,
+    # zodat nooit alle rijen tegelijk in het geheugen staan: {jaar: (piek, [tijdstippen])}
+    best: Dict[int, Tuple[float, List[str]]] = {}
+    chunks = execute_query(query, chunksize=50_000)
+
+    try:
+        for chunk in chunks or ():
+            renewable = chunk["measured_wind_MW"].to_numpy() + chunk["measured_solar_MW"].to_numpy()
+            years = chunk["year"].to_numpy()
+            moments = chunk["datetime"].to_numpy()
+
+            for i in _peak_per_year(years, renewable):
+                year, value, moment = int(years[i]), renewable[i], str(moments[i])
+                if year not in best or value > best[year][0]:
+                    best[year] = (value, [moment])
+                elif value == best[year][0]:
+                    best[year][1].append(moment)
+    except Exception as e:
+        # Afgebroken iteratie: geen pieken berekenen op basis van slechts een deel van de data
+        log.error("❌ Onverwachte fout: %s", e)
+        log.warning("⚠️ Geen resultaten gevonden voor piekproductie hernieuwbaar.")
         return pd.DataFrame()
 
-    df = df.rename(columns={
-            "date": TRANSLATIONS["date"][lang],
-            "time": TRANSLATIONS["time"][lang],
-            "renewable_peak": TRANSLATIONS["labels"]["renewable_peak"][lang],
-        })
+    if not best:
+        log.warning("⚠️ Geen resultaten gevonden voor piekproductie hernieuwbaar.")
+        return pd.DataFrame()
+
+    peaks = [(value, moment) for value, moments in best.values() for moment in moments]
+
+    # Kolommen meteen onder hun vertaalde naam opbouwen (geen rename-kopie achteraf)
+    df = pd.DataFrame({
+        TRANSLATIONS["date"][lang]: [moment[:10] for _, moment in peaks],
+        TRANSLATIONS["time"][lang]: [moment[11:19] for _, moment in peaks],
+        # Afkappen naar een geheel getal, zoals CAST(... AS INTEGER) in SQLite
+        TRANSLATIONS["labels"]["renewable_peak"][lang]: np.array([value for value, _ in peaks]).astype("int64"),
+    })
 
     return df
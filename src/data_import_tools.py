@@ -17,36 +17,74 @@ Functies:
 
 import os
 import calendar
-import json
 import time
 import shutil
-from datetime import datetime
+from datetime import date, datetime, timedelta
 import zipfile
-from typing import Optional, List, Dict, Any, Tuple, Literal
+from contextlib import contextmanager, nullcontext, ExitStack
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Optional, List, Dict, Any, Tuple, Literal, Iterator, Set, TYPE_CHECKING
 
-from src.utils.package_tools import update_or_install_if_missing
+from src.utils.package_tools import ensure_packages
+from src.utils.file_tools import iter_json_files
 from src.utils.decorators import retry_on_failure
-from settings import HTTP_TIMEOUT, DEFAULT_ATTEMPTS, RETRY_DELAY, BELPEX_DIR, SOLAR_FORECAST_DIR, WIND_FORECAST_DIR, BASE_DIR
+from settings import HTTP_TIMEOUT, DEFAULT_ATTEMPTS, RETRY_DELAY, HTTP_MAX_WORKERS, IMPORT_MAX_WORKERS, ZIP_COMPRESSLEVEL, BELPEX_DIR, SOLAR_FORECAST_DIR, WIND_FORECAST_DIR, BASE_DIR
+from settings import SKIP_DEP_CHECK
 
 # Controleer en installeer indien nodig de vereiste modules
 # Dit is een vangnet als de gebruiker geen rekening houdt met requirements.txt.
-update_or_install_if_missing("requests","2.25.0")
-update_or_install_if_missing("selenium","4.1.0")
-update_or_install_if_missing("webdriver_manager","3.5.0")
-update_or_install_if_missing("pandas","1.3.0")
-update_or_install_if_missing("openpyxl","3.1.0")
+# requirements.txt blijft de referentie: in een reeds ingerichte omgeving kan deze controle
+# (die elke module importeert en de versie nakijkt) overgeslagen worden via SKIP_DEP_CHECK=1.
+if not SKIP_DEP_CHECK:
+    # Alle ontbrekende of verouderde packages worden samen in één pip-aanroep geïnstalleerd.
+    ensure_packages({
+        "requests": "2.25.0",
+        "pandas": "2.2.0",
+        "openpyxl": "3.1.0",
+        "orjson": "3.6.0",
+    })
 
 # Pas na installatie importeren
 from src.utils.safe_requests import safe_requests_get
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 import pandas as pd
+import orjson
+
+# Selenium is enkel nodig voor de Belpex-download en wordt pas in de betrokken functies geïmporteerd,
+# zodat de wind- en zonnefuncties (bv. onder PyPy) zonder Selenium gebruikt kunnen worden
+# (de installatiecontrole voor Selenium gebeurt in `setup_chrome_driver`).
+if TYPE_CHECKING:
+    from selenium import webdriver
+
+# ----------- Hulpfuncties -----------
+
+def _ts() -> str:
+    """
+    Geef het huidige tijdstip terug als 'YYYY-MM-DD HH:MM:SS' voor de logregels.
+
+    Gebruikt `time.strftime` rechtstreeks (zonder tussenliggend datetime-object).
+    """
+    return time.strftime('%Y-%m-%d %H:%M:%S')
+
+@lru_cache(maxsize=256)
+def _days_in_month(
+    year: int,
+    month: int
+) -> int:
+    """
+    Geef het aantal dagen in een maand terug (resultaat van `calendar.monthrange`, bewaard per jaar/maand).
+    """
+    return calendar.monthrange(year, month)[1]
 
 # ----------- Data Import Functies -----------
 
+# Maximaal aantal dagen per API-query: de Elia API geeft per query hoogstens 10.000 records terug
+# (offset + limit) en winddata telt ongeveer 480 records per dag.
+MAX_RANGE_DAYS = 7
+
+# Dagnummers '01' t.e.m. '31', één keer geformatteerd
+_DAY_STRINGS = tuple(f"{day:02d}" for day in range(1, 32))
+
 def get_days_in_month(
     year: int, 
     month: int
@@ -61,8 +99,8 @@ def get_days_in_month(
     Returns:
         List[str]: Een lijst met datums in het formaat 'YYYY-MM-DD'.
     """
-    _, num_days = calendar.monthrange(year, month)
-    return [f"{year}-{month:02d}-{day:02d}" for day in range(1, num_days + 1)]
+    prefix = f"{year}-{month:02d}-"
+    return [prefix + day for day in _DAY_STRINGS[:_days_in_month(year, month)]]
 
 def fetch_forecast_day(
     url: str,
@@ -70,7 +108,9 @@ def fetch_forecast_day(
     extra_filters: Optional[List[str]] = None
 ) -> List[Dict[str, Any]]:
     """
-    Haal alle records (in batches) van de Elia API op voor een specifieke dag.
+    Haal alle records van de Elia API op voor een specifieke dag.
+
+    Dunne wrapper rond `iter_forecast_range` voor een periode van één dag, zodat er één ophaalpad is.
 
     Parameters:
     - url (str): API-endpoint (wind of solar dataset).
@@ -80,24 +120,47 @@ def fetch_forecast_day(
     Returns:
     - list[dict]: Alle records van die dag.
     """
+    until_date = (date.fromisoformat(date_str) + timedelta(days=1)).isoformat()
+    return [record for batch in iter_forecast_range(url, date_str, until_date, extra_filters) for record in batch]
+
+def iter_forecast_range(
+    url: str,
+    from_date: str,
+    until_date: str,
+    extra_filters: Optional[List[str]] = None
+) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Overloop de records van de Elia API voor een aaneengesloten periode van dagen, per batch (pagina).
+
+    Eén gepagineerde query over meerdere dagen vervangt een aparte reeks verzoeken per dag.
+    De API laat maximaal 10.000 records per query toe (offset + limit); houd de periode daarom
+    beperkt (zie `MAX_RANGE_DAYS`: een week winddata is ongeveer 3.400 records).
+    Doordat de batches één voor één teruggegeven worden, hoeft de aanroeper niet de hele periode
+    in het geheugen te houden.
+
+    Parameters:
+    - url (str): API-endpoint (wind of solar dataset).
+    - from_date (str): Eerste dag (inclusief) in formaat YYYY-MM-DD.
+    - until_date (str): Dag na de laatste dag (exclusief) in formaat YYYY-MM-DD.
+    - extra_filters (list[str], optioneel): Extra filters zoals regio.
+
+    Returns:
+    - Iterator[list[dict]]: De records per batch, gesorteerd op tijd.
+    """
 
-    all_records = []
     limit = 100  # Elia legt een beperking op van 100 records per call
     offset = 0
 
     while True:
-        # Stel API-filters samen
-        refine = [f'datetime:"{date_str}"']  # Filter op specifieke dag
-        if extra_filters:
-            refine.extend(extra_filters)     # Extra filters zoals vb. Belgische regio
-
-        # API-parameters inclusief filter
+        # API-parameters inclusief filter op de periode (datums in UTC, zoals de dagbestanden)
         params = {
+            "where": f"datetime >= date'{from_date}' and datetime < date'{until_date}'",
             "order_by": "datetime",          # Sorteer op tijd
             "limit": limit,                  # Aantal records per batch
             "offset": offset,                # Startpunt voor batch
-            "refine": refine
         }
+        if extra_filters:
+            params["refine"] = extra_filters # Extra filters zoals vb. Belgische regio
 
         # Voer het verzoek uit via de veilige request-functie met retry
         response = safe_requests_get(
@@ -110,23 +173,23 @@ def fetch_forecast_day(
 
         # Extra controle op HTTP-status (niet echt nodig door raise_for_status(), maar extra informatief)
         if response.status_code != 200:
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ❌ Fout bij {date_str} (offset {offset}): {response.status_code}")
+            print(f"{_ts()} -       ❌ Fout bij {from_date} t.e.m. {until_date} (offset {offset}): {response.status_code}")
             break
 
-        # Haal JSON-gegevens op, neem alleen 'results' (records)
-        data = response.json().get("results", [])
-        if not data:
-            break  # Geen data meer, stop loop
+        # Haal JSON-gegevens op (via orjson, sneller dan response.json()), neem alleen 'results' (records)
+        data = orjson.loads(response.content).get("results", [])
+        if data:
+            yield data
 
-        all_records.extend(data)
+        # Een onvolledige batch betekent dat er geen data meer is
+        if len(data) < limit:
+            break
 
-        # Print voortgang als er batches zijn
-        if offset != 0:
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⏳ De eerste {offset} records werden binnengehaald.", end='\r')
+        # Print voortgang als er batches zijn (om de 5 batches, i.p.v. na elke batch)
+        if offset != 0 and offset % (limit * 5) == 0:
+            print(f"{_ts()} -       ⏳ {from_date} t.e.m. {until_date}: de eerste {offset} records werden binnengehaald.", end='\r')
         offset += limit
 
-    return all_records
-
 def save_forecast_json(
     output_path: str,
     records: List[Dict[str, Any]]
@@ -134,12 +197,22 @@ def save_forecast_json(
     """
     Sla een lijst van records op in een JSON-bestand.
 
+    De bestanden worden enkel door de scripts ingelezen: ze worden compact (zonder inspringing)
+    en in UTF-8 weggeschreven via orjson. Dat is sneller en de bestanden (en zips) worden kleiner.
+    Voor leesbare uitvoer kan `option=orjson.OPT_INDENT_2` meegegeven worden aan `orjson.dumps`.
+
+    Het bestand wordt eerst naar een tijdelijk bestand geschreven en pas daarna (atomair) hernoemd,
+    zodat een onderbroken schrijfactie nooit een half JSON-bestand achterlaat dat bij een volgende
+    run als 'reeds aanwezig' overgeslagen zou worden.
+
     Parameters:
     - output_path (str): Volledig pad naar het te schrijven bestand.
     - records (list[dict]): Lijst met datarecords.
     """
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump(records, f, ensure_ascii=False, indent=2)
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(orjson.dumps(records))
+    os.replace(tmp_path, output_path)
 
 @retry_on_failure(tries=DEFAULT_ATTEMPTS, delay=RETRY_DELAY)
 def import_forecast(
@@ -169,37 +242,107 @@ def import_forecast(
 
     Werking:
     - Controleert per dag of het JSON-bestand al bestaat; zo ja, deze dag wordt overgeslagen.
-    - Haalt records op in batches van 100 (beperking van Elia API).
-    - Print status per dag en per batch.
+    - Bundelt opeenvolgende ontbrekende dagen tot periodes van maximaal `MAX_RANGE_DAYS` dagen en haalt
+      elke periode met één gepagineerde query op (zie `iter_forecast_range`), i.p.v. per dag apart.
+    - Haalt de periodes gelijktijdig op (maximaal `HTTP_MAX_WORKERS` threads), zodat de
+      wachttijd op het netwerk overlapt in plaats van op te tellen.
+    - Haalt records op in batches van 100 (beperking van Elia API) en schrijft elke dag weg zodra die volledig is.
+    - Print status per dag.
     - Slaat de records op in een JSON-bestand met naam <prefix>_YYYYMMDD.json.
     - Print of het bestand succesvol is opgeslagen of dat er geen data beschikbaar was.
+    - Mislukt het ophalen van een periode, dan worden de andere periodes nog opgeslagen en wordt de fout
+      daarna doorgegeven (de retry haalt dan enkel de ontbrekende dagen opnieuw op).
     """
 
     # Maak de jaarmap aan indien nodig
     os.makedirs(year_folder, exist_ok=True)
 
-    # Loop over elke dag van de maand
+    # Bestaande bestanden één keer oplijsten i.p.v. per dag een stat-aanroep (os.path.exists)
+    with os.scandir(year_folder) as entries:
+        existing_files = frozenset(entry.name for entry in entries)
+
+    # Mappad één keer samenstellen; per dag volstaat dan een eenvoudige stringconcatenatie
+    folder_prefix = os.path.join(year_folder, "")
+
+    # Bepaal welke dagen van de maand nog ontbreken
+    missing_days = []
     for date_str in get_days_in_month(year, month):
-        # Bestandsnaam en volledig pad genereren voor output
+        # Bestandsnaam genereren voor output
         output_filename = f"{prefix}_{date_str.replace('-', '')}.json"
-        output_path = os.path.join(year_folder, output_filename)
 
         # Indien het bestand reeds bestaat, sla deze dag over
-        if os.path.exists(output_path):
-            #print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ✅ Bestand bestaat al: {output_filename}")
+        if output_filename in existing_files:
+            #print(f"{_ts()} - ✅ Bestand bestaat al: {output_filename}")
             continue
 
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⬇️ Ophalen: {output_filename}")
+        print(f"{_ts()} -       ⬇️ Ophalen: {output_filename}")
+        missing_days.append((date_str, output_filename, folder_prefix + output_filename))
 
-        # Ophalen van alle records voor deze dag
-        all_records = fetch_forecast_day(url, date_str, extra_filters)
+    if not missing_days:
+        return
 
-        # Als er data gevonden werd, sla deze op in JSON-bestand
-        if all_records:
-            save_forecast_json(output_path, all_records)
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ✅ Opgeslagen ({len(all_records)} records): {output_filename}")
+    # Opeenvolgende ontbrekende dagen bundelen tot periodes van maximaal MAX_RANGE_DAYS dagen
+    ranges: List[List[Tuple[str, str, str]]] = []
+    previous_day = None
+    for day in missing_days:
+        current_day = datetime.strptime(day[0], "%Y-%m-%d")
+        if ranges and len(ranges[-1]) < MAX_RANGE_DAYS and current_day - previous_day == timedelta(days=1):
+            ranges[-1].append(day)
         else:
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ❌ Geen data voor {date_str}")
+            ranges.append([day])
+        previous_day = current_day
+
+    def import_range(days: List[Tuple[str, str, str]]) -> None:
+        """
+        Haal één periode op en schrijf elke dag weg zodra die volledig binnen is (records zijn op tijd gesorteerd),
+        zodat er hoogstens één dag aan records in het geheugen zit.
+        """
+        from_date = days[0][0]
+        until_date = (datetime.strptime(days[-1][0], "%Y-%m-%d") + timedelta(days=1)).strftime("%Y-%m-%d")
+        paths = {date_str: (output_filename, output_path) for date_str, output_filename, output_path in days}
+        saved = set()
+        current_day, current_records = None, []
+
+        def save_day() -> None:
+            # Als er data gevonden werd, sla deze op in JSON-bestand
+            if current_records and current_day in paths:
+                output_filename, output_path = paths[current_day]
+                save_forecast_json(output_path, current_records)
+                saved.add(current_day)
+                print(f"{_ts()} -       ✅ Opgeslagen ({len(current_records)} records): {output_filename}")
+
+        for batch in iter_forecast_range(url, from_date, until_date, extra_filters):
+            for record in batch:
+                # datetime begint met YYYY-MM-DD
+                record_day = record["datetime"][:10]
+                if record_day != current_day:
+                    save_day()
+                    current_day, current_records = record_day, []
+                current_records.append(record)
+        save_day()
+
+        for date_str, _, _ in days:
+            if date_str not in saved:
+                print(f"{_ts()} -       ❌ Geen data voor {date_str}")
+
+    first_error = None
+
+    # Ophalen van de periodes, meerdere tegelijk (I/O-gebonden, dus threads volstaan)
+    with ThreadPoolExecutor(max_workers=min(HTTP_MAX_WORKERS, len(ranges))) as executor:
+        futures = {executor.submit(import_range, days): days for days in ranges}
+
+        for future in as_completed(futures):
+            days = futures[future]
+            try:
+                future.result()
+            except Exception as e:
+                # Reeds volledig opgehaalde dagen van deze periode zijn al opgeslagen
+                print(f"{_ts()} -       ❌ Fout bij {days[0][0]} t.e.m. {days[-1][0]}: {e}")
+                first_error = first_error or e
+
+    # Fout doorgeven, zodat de retry-decorator de ontbrekende dagen opnieuw probeert
+    if first_error is not None:
+        raise first_error
 
 def import_wind(
     year: int,
@@ -252,27 +395,13 @@ def get_belpex_date_range(
     - tuple[str, str]: Een tuple met (from_date, until_date) in formaat yyyy-mm-dd.
     """
 
-    # Bepaal de laatste dag van de vorige maand voor de 'from_date'
-    if month == 1:
-        previous_month = 12
-        previous_year = year - 1
-    else:
-        previous_month = month - 1
-        previous_year = year
-    _, days_previous_month = calendar.monthrange(previous_year, previous_month)
-    previous_month_last_day = datetime(previous_year, previous_month, days_previous_month)
-    
-    from_date = previous_month_last_day.strftime("%Y-%m-%d")
+    first_day = date(year, month, 1)
 
-    # Bepaal de eerste dag van de volgende maand voor de 'until_date'
-    if month == 12:
-        next_month = 1
-        next_year = year + 1
-    else:
-        next_month = month + 1
-        next_year = year
-    next_month_first_day = datetime(next_year, next_month, 1)
-    until_date = next_month_first_day.strftime("%Y-%m-%d")
+    # 'from_date': de laatste dag van de vorige maand
+    from_date = (first_day - timedelta(days=1)).isoformat()
+
+    # 'until_date': de eerste dag van de volgende maand
+    until_date = (first_day + timedelta(days=_days_in_month(year, month))).isoformat()
 
     return from_date, until_date
 
@@ -296,13 +425,13 @@ def prepare_download_dir(
     file_path = os.path.join(download_dir, filename)
     if os.path.exists(file_path):
         os.remove(file_path)
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ❌ Niet hernoemde bestand {filename} werd verwijderd.")
+        print(f"{_ts()} -       ❌ Niet hernoemde bestand {filename} werd verwijderd.")
 
     return download_dir, file_path
 
 def setup_chrome_driver(
     download_dir: str
-) -> webdriver.Chrome:
+) -> "webdriver.Chrome":
     """
     Configureer een headless Chrome-driver voor automatisch downloaden.
 
@@ -312,6 +441,11 @@ def setup_chrome_driver(
     Returns:
     - webdriver.Chrome: Een geconfigureerde headless Chrome-driver.
     """
+    # Selenium is enkel nodig voor Belpex: pas hier controleren/installeren en importeren
+    if not SKIP_DEP_CHECK:
+        ensure_packages({"selenium": "4.1.0", "webdriver_manager": "3.5.0"})
+    from selenium import webdriver
+    from selenium.webdriver.chrome.options import Options
 
     options = Options()
     prefs = {
@@ -324,39 +458,70 @@ def setup_chrome_driver(
     options.add_experimental_option("prefs", prefs)
     return webdriver.Chrome(options=options)
 
+@contextmanager
+def chrome_session(
+    download_dir: str
+) -> Iterator["webdriver.Chrome"]:
+    """
+    Contextmanager rond `setup_chrome_driver`: start één browser en sluit die altijd weer af.
+
+    Parameters:
+    - download_dir (str): Het pad waar downloads automatisch opgeslagen moeten worden.
+
+    Returns:
+    - Iterator[webdriver.Chrome]: De gestarte driver (via `with chrome_session(...) as driver:`).
+    """
+    driver = setup_chrome_driver(download_dir)
+    try:
+        yield driver
+    finally:
+        try:
+            driver.quit()
+        except Exception as e:
+            # Een gecrashte browser (of ongeldige sessie) kan een fout geven bij het afsluiten
+            print(f"{_ts()} -       ⚠️ Browser kon niet netjes afgesloten worden: {e}")
+
 def download_belpex_xlsx(
-    driver: webdriver.Chrome,
+    driver: "webdriver.Chrome",
     from_date: str,
-    until_date: str
+    until_date: str,
+    download_file: Optional[str] = None
 ) -> None:
     """
     Download Excel Belpex-bestanden via Elexys.
+
+    Is `download_file` opgegeven, dan wordt gewacht tot dat bestand volledig gedownload is
+    (maximaal 30 seconden, zonder lopende .crdownload-bestanden) i.p.v. een vaste wachttijd.
     """
+    from selenium.webdriver.common.by import By
+    from selenium.webdriver.support.ui import WebDriverWait
+    from selenium.webdriver.support import expected_conditions as EC
+    from selenium.common.exceptions import TimeoutException
 
     url = (f"https://www.elexys.be/insights/quarter-hourly-belpex-day-ahead-spot-be?from={from_date}&until={until_date}")
-    print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       🌐 Open URL: {url}")
+    print(f"{_ts()} -       🌐 Open URL: {url}")
     driver.get(url)
 
     # Sluit interactieve popup indien aanwezig
     try:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⏳ Controleren op popup...")
+        print(f"{_ts()} -       ⏳ Controleren op popup...")
 
         wait.until(EC.element_to_be_clickable((By.ID, "interactive-close-button")))
         close_btn = driver.find_element(By.ID, "interactive-close-button")
 
         driver.execute_script("arguments[0].click();", close_btn)
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ❌ Popup gesloten")
+        print(f"{_ts()} -       ❌ Popup gesloten")
 
         time.sleep(1)  # Mini delay voor stabiliteit
     except Exception:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ✔️ Geen popup gevonden")
+        print(f"{_ts()} -       ✔️ Geen popup gevonden")
     
     wait = WebDriverWait(driver, 20)
     
     time.sleep(2)
 
     # Zoek ALLE exportknoppen
-    print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⏳ Wachten op exportknoppen...")
+    print(f"{_ts()} -       ⏳ Wachten op exportknoppen...")
     buttons = wait.until(
         EC.presence_of_all_elements_located(
             (By.CSS_SELECTOR, "a.c-insights-export-button")
@@ -368,13 +533,28 @@ def download_belpex_xlsx(
         text = btn.text.strip().lower()
 
         if "excel" in text:
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       🚀 Klik op 'Export Excel'")
+            print(f"{_ts()} -       🚀 Klik op 'Export Excel'")
             # Klik op de juiste export-div
             driver.execute_script("arguments[0].click();", btn)
 
     # Wacht op de download
-    print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⏳ Wacht op download...")
-    time.sleep(5)  # Wacht op downloads
+    print(f"{_ts()} -       ⏳ Wacht op download...")
+    if download_file is None:
+        time.sleep(5)  # Wacht op downloads
+        return
+
+    # Pollen tot het bestand er staat: klaar zodra de download voltooid is
+    download_dir = os.path.dirname(download_file)
+
+    def download_complete(_driver: "webdriver.Chrome") -> bool:
+        return os.path.exists(download_file) and not any(
+            name.endswith(".crdownload") for name in os.listdir(download_dir)
+        )
+
+    try:
+        WebDriverWait(driver, 30, poll_frequency=0.5).until(download_complete)
+    except TimeoutException:
+        print(f"{_ts()} -       ⚠️  Download niet voltooid binnen 30 seconden.")
 
 def rename_belpex_file(
     download_file: str,
@@ -399,9 +579,9 @@ def rename_belpex_file(
 
     if os.path.exists(download_file):
         os.rename(download_file, new_path)
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ✅ Gedownload en hernoemd naar: {new_filename}")
+        print(f"{_ts()} -       ✅ Gedownload en hernoemd naar: {new_filename}")
     else:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ❌ Download mislukt.")
+        print(f"{_ts()} -       ❌ Download mislukt.")
 
 def convert_elexys_xlsx_to_csv(xlsx_path: str, csv_path: str, year: int, month: int) -> None:
     """
@@ -441,9 +621,11 @@ def convert_elexys_xlsx_to_csv(xlsx_path: str, csv_path: str, year: int, month:
 
     # Probeer Excel in te lezen
     try:
-        df = pd.read_excel(xlsx_path, skiprows=2)
+        # Alles als tekst inlezen: de kolommen worden hieronder zelf geparst, zodat pandas geen types moet afleiden
+        # (openpyxl opent het bestand via pandas al in read_only-modus)
+        df = pd.read_excel(xlsx_path, skiprows=2, engine="openpyxl", dtype=str)
     except Exception as e:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⚠️  Kon Excel-bestand '{os.path.basename(xlsx_path)}' niet inlezen: {e}")
+        print(f"{_ts()} -       ⚠️  Kon Excel-bestand '{os.path.basename(xlsx_path)}' niet inlezen: {e}")
         return
 
     # Verwijder volledig lege rijen
@@ -451,7 +633,7 @@ def convert_elexys_xlsx_to_csv(xlsx_path: str, csv_path: str, year: int, month:
 
     # Controleren of het bestand info bevat
     if df.empty:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⚠️  Geen data beschikbaar in XLSX-bestand '{os.path.basename(xlsx_path)}' — conversie overgeslagen.")
+        print(f"{_ts()} -       ⚠️  Geen data beschikbaar in XLSX-bestand '{os.path.basename(xlsx_path)}' — conversie overgeslagen.")
         return
 
     # Kolomnamen opschonen
@@ -460,7 +642,7 @@ def convert_elexys_xlsx_to_csv(xlsx_path: str, csv_path: str, year: int, month:
     # Controleren of vereiste kolommen aanwezig zijn
     required_cols = {"Datum", "Time", "Euro"}
     if not required_cols.issubset(df.columns):
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⚠️  Vereiste kolommen ontbreken in XLSX-bestand '{os.path.basename(xlsx_path)}' — gevonden kolommen: {list(df.columns)}")
+        print(f"{_ts()} -       ⚠️  Vereiste kolommen ontbreken in XLSX-bestand '{os.path.basename(xlsx_path)}' — gevonden kolommen: {list(df.columns)}")
         return
 
     # Titel verwijderen indien aanwezig
@@ -468,23 +650,18 @@ def convert_elexys_xlsx_to_csv(xlsx_path: str, csv_path: str, year: int, month:
         df = df.iloc[1:].dropna(how="all").reset_index(drop=True)
 
     if df.empty:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⚠️  XLSX '{os.path.basename(xlsx_path)}' bevat geen datarijen na verwijderen titel — conversie overgeslagen.")
+        print(f"{_ts()} -       ⚠️  XLSX '{os.path.basename(xlsx_path)}' bevat geen datarijen na verwijderen titel — conversie overgeslagen.")
         return
 
-    # Converteer Time (bv. '0u45') naar '00:45'
-    def convert_time(t: str) -> str:
-        t = t.strip().lower()
-        if "u" in t:
-            hour, minute = t.split("u")
-            return f"{int(hour):02d}:{int(minute):02d}"
-        return t
-
-    # Combineer Datum + Time
+    # Combineer Datum + Time (bv. '0u45' of '00:45'), volledig gevectoriseerd i.p.v. per rij
     try:
-        df["Time"] = df["Time"].astype(str).apply(convert_time)
-        df["Date"] = pd.to_datetime(df["Datum"] + " " + df["Time"], format="%d/%m/%Y %H:%M")
+        time_parts = df["Time"].astype(str).str.strip().str.lower().str.extract(r"^(\d{1,2})[u:](\d{1,2})$")
+        if time_parts.isna().any().any():
+            raise ValueError("onbekend tijdformaat in kolom 'Time'")
+        minutes = time_parts[0].astype("int64") * 60 + time_parts[1].astype("int64")
+        df["Date"] = pd.to_datetime(df["Datum"], format="%d/%m/%Y") + pd.to_timedelta(minutes, unit="m")
     except Exception as e:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⚠️  Datum/Tijd kon niet worden geconverteerd: {e}")
+        print(f"{_ts()} -       ⚠️  Datum/Tijd kon niet worden geconverteerd: {e}")
         return
 
     # Filter enkel rijen voor het juiste jaar + maand
@@ -492,16 +669,19 @@ def convert_elexys_xlsx_to_csv(xlsx_path: str, csv_path: str, year: int, month:
 
     # Controleer of na filtering nog rijen beschikbaar zijn
     if df.empty:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⚠️  Geen data voor {year}-{month:02d} — CSV niet aangemaakt.")
+        print(f"{_ts()} -       ⚠️  Geen data voor {year}-{month:02d} — CSV niet aangemaakt.")
         return
 
     # Euro converteren naar numeriek
-    df["Euro"] = df["Euro"].astype(str).str.replace("€", "").str.replace(",", ".").str.strip()
-    df["Euro"] = pd.to_numeric(df["Euro"], errors="coerce")
+    # (euroteken en witruimte in één regex-doorloop verwijderen, daarna decimale komma omzetten)
+    df["Euro"] = pd.to_numeric(
+        df["Euro"].astype(str).str.replace(r"[€\s]", "", regex=True).str.replace(",", ".", regex=False),
+        errors="coerce"
+    )
 
     df = df.dropna(subset=["Euro"])
     if df.empty:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⚠️  Geen data voor {year}-{month:02d} — CSV niet aangemaakt.")
+        print(f"{_ts()} -       ⚠️  Geen data voor {year}-{month:02d} — CSV niet aangemaakt.")
         return
 
     # Uur afleiden
@@ -514,20 +694,39 @@ def convert_elexys_xlsx_to_csv(xlsx_path: str, csv_path: str, year: int, month:
     df_hourly["Date"] = df_hourly["Hour"].dt.strftime("%d/%m/%Y %H:%M:%S")
 
     # Euro weer formatteren in de oude layout
-    df_hourly["Euro"] = df_hourly["Euro"].apply(lambda x: f"€ € {x:.2f}".replace(".", ","))
+    df_hourly["Euro"] = "€ € " + df_hourly["Euro"].map("{:.2f}".format).str.replace(".", ",", regex=False)
 
     # Output
     df_out = df_hourly[["Date", "Euro"]]
 
-    # Wegschrijven als ANSI (cp1252)
-    df_out.to_csv(csv_path, sep=";", index=False, encoding="cp1252")
+    # Wegschrijven als ANSI (cp1252) via een buffer van 1 MB, met '\n' als regeleinde zoals de
+    # historische CSV-bestanden (ook op Windows, waar pandas standaard '\r\n' gebruikt)
+    with open(csv_path, "w", encoding="cp1252", newline="", buffering=1024 * 1024) as f:
+        df_out.to_csv(f, sep=";", index=False, lineterminator="\n")
 
-    print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       💾 Conversie naar CSV voltooid: '{os.path.basename(csv_path)}'")
+    print(f"{_ts()} -       💾 Conversie naar CSV voltooid: '{os.path.basename(csv_path)}'")
+
+def get_belpex_csv_path(
+    year: int,
+    month: int
+) -> str:
+    """
+    Geef het pad terug van het (geconverteerde) Belpex CSV-bestand voor een maand.
+
+    Parameters:
+    - year (int): Het jaar.
+    - month (int): De maand (1 t.e.m. 12).
+
+    Returns:
+    - str: Pad naar <BELPEX_DIR>/Belpex_YYYYMM.csv
+    """
+    return os.path.join(str(BELPEX_DIR), f"Belpex_{year}{month:02d}.csv")
 
 @retry_on_failure(tries=DEFAULT_ATTEMPTS, delay=RETRY_DELAY, backoff=2)
 def import_belpex(
     year: int,
-    month: int
+    month: int,
+    driver: Optional["webdriver.Chrome"] = None
 ) -> None:
     """
     Download Belpex-spotmarktprijzen via browserautomatisering (Selenium).
@@ -539,6 +738,11 @@ def import_belpex(
     Parameters:
     - year (int): Het jaar waarvoor data opgehaald moet worden.
     - month (int): De maand waarvoor data opgehaald moet worden (1 t.e.m. 12).
+    - driver (webdriver.Chrome, optioneel): Een reeds gestarte driver (zie `setup_chrome_driver`) die
+      hergebruikt wordt, bv. over meerdere maanden heen in `update_data`. De aanroeper sluit die driver zelf,
+      en moet bij een WebDriverException (gecrashte browser, ongeldige sessie) zelf een nieuwe driver starten:
+      de herhaalde pogingen van deze functie gebruiken dezelfde driver (zie `update_data`).
+      Indien None, wordt voor deze maand een eigen browser gestart en nadien gesloten.
 
     Opmerkingen:
     - Gebruikt een headless Chrome-browser (geen visueel venster).
@@ -548,66 +752,132 @@ def import_belpex(
     
     from_date, until_date = get_belpex_date_range(year, month)
     download_dir, download_file = prepare_download_dir(BELPEX_DIR)
-    new_filename_csv = f"Belpex_{year}{month:02d}.csv"
-    new_file_csv_path = os.path.join(download_dir, new_filename_csv)
+    new_file_csv_path = get_belpex_csv_path(year, month)
     new_filename_xlsx = f"Belpex_{year}{month:02d}.xlsx"
     new_file_xlsx_path = os.path.join(download_dir, new_filename_xlsx)
 
     # Indien het csv-bestand reeds bestaat, sla deze maand over
     if os.path.exists(new_file_csv_path):
-        #print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ✅ Bestand bestaat al: {new_filename_csv}")
+        #print(f"{_ts()} - ✅ Bestand bestaat al: {os.path.basename(new_file_csv_path)}")
         return
 
     # xlxs-bestand verwijderen als dit bestaat
     if os.path.exists(new_file_xlsx_path):
         os.remove(new_file_xlsx_path)
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ❌ {new_filename_xlsx} werd verwijderd.")
+        print(f"{_ts()} -       ❌ {new_filename_xlsx} werd verwijderd.")
 
-    driver = setup_chrome_driver(download_dir)
-
-    try:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ⬇️ Starten met het opvragen Belpex-gegevens periode {month}/{year}")
-        download_belpex_xlsx(driver, from_date, until_date)
+    # Eigen browser enkel als er geen werd meegegeven (die wordt dan na deze maand weer gesloten)
+    with chrome_session(download_dir) if driver is None else nullcontext(driver) as driver:
+        print(f"{_ts()} -       ⬇️ Starten met het opvragen Belpex-gegevens periode {month}/{year}")
+        download_belpex_xlsx(driver, from_date, until_date, download_file=download_file)
         rename_belpex_file(download_file, year, month)
         convert_elexys_xlsx_to_csv(new_file_xlsx_path, new_file_csv_path, year=year, month=month)
-    finally:
-        # Sluit de browser
-        driver.quit()
 
 
 # ----------- Zip Functies -----------
 
-def file_needs_zip(
+# Aantal bestanden dat per keer vooraf ingelezen wordt bij het zippen (begrenst het geheugengebruik)
+ZIP_READ_BATCH = 32
+
+def _read_zip_member(
+    path: str,
+    arcname: str
+) -> Tuple[zipfile.ZipInfo, bytes]:
+    """
+    Lees een bestand in voor de zip, samen met de ZipInfo (naam, modificatietijd en rechten).
+    """
+    zinfo = zipfile.ZipInfo.from_file(path, arcname)
+    zinfo.compress_type = zipfile.ZIP_DEFLATED
+    with open(path, 'rb') as f:
+        return zinfo, f.read()
+
+def _write_zip_members(
+    zipf: zipfile.ZipFile,
+    members: List[Tuple[str, str]]
+) -> None:
+    """
+    Schrijf bestanden naar een open zip, waarbij het inlezen overlapt met het comprimeren.
+
+    Een kleine threadpool leest telkens `ZIP_READ_BATCH` bestanden vooraf in, terwijl de huidige
+    thread ze (in de oorspronkelijke volgorde) comprimeert via `writestr`.
+
+    Parameters:
+    - zipf (zipfile.ZipFile): Zip geopend in mode 'w' of 'a'.
+    - members (list[tuple[str, str]]): Lijst van (pad op schijf, naam in de zip).
+    """
+    with ThreadPoolExecutor(max_workers=4) as readers:
+        for start in range(0, len(members), ZIP_READ_BATCH):
+            batch = members[start:start + ZIP_READ_BATCH]
+            for zinfo, data in readers.map(lambda member: _read_zip_member(*member), batch):
+                zipf.writestr(zinfo, data, compresslevel=ZIP_COMPRESSLEVEL)
+
+def _scan_year(
+    type_folder: str,
+    year_path: str
+) -> Tuple[List[Tuple[str, str, float]], float]:
+    """
+    Overloop een jaarmap één keer en geef de JSON-bestanden en de recentste wijzigingstijd terug.
+
+    Met het resultaat kan `zip_forecast_data` zowel beslissen of er gezipt moet worden als de
+    bestandenlijst voor het zippen gebruiken, zonder de map een tweede keer te doorlopen.
+
+    Parameters:
+    - type_folder (str): Map van het forecasttype; paden in de zip zijn relatief hieraan.
+    - year_path (str): Jaarmap met de JSON-bestanden.
+
+    Returns:
+    - tuple[list[tuple[str, str, float]], float]: Lijst van (pad, naam in de zip, wijzigingstijd),
+      gesorteerd op naam, en de grootste wijzigingstijd (0.0 als er geen bestanden zijn).
+    """
+    # Gesorteerd op naam, zodat de volgorde in de zip vast ligt (chronologisch per dag)
+    files = sorted(
+        (entry.path, os.path.relpath(entry.path, type_folder).replace(os.sep, '/'), entry.stat().st_mtime)
+        for entry in iter_json_files(year_path)
+    )
+    max_mtime = max((mtime for _, _, mtime in files), default=0.0)
+    return files, max_mtime
+
+def _zip_one_year(
     zip_path: str,
-    folder_path: str
-) -> bool:
+    files: List[Tuple[str, str, float]]
+) -> str:
     """
-    Controleer of een ZIP-bestand ouder is dan de JSON-bestanden in een opgegeven map.
+    Bundel alle JSON-bestanden van één jaarmap in een ZIP-bestand.
+
+    Bestaat de zip al, dan worden enkel de nieuwe JSON-bestanden toegevoegd (mode 'a'), zodat bij
+    een paar nieuwe dagen niet het hele jaar opnieuw gecomprimeerd wordt. Alleen als een bestand dat
+    al in de zip zit gewijzigd werd, wordt de zip volledig opnieuw opgebouwd.
+
+    In beide gevallen wordt in een tijdelijk bestand ('.tmp') gewerkt dat pas op het einde de bestaande zip
+    vervangt (`os.replace`): een onderbreking tijdens het schrijven laat de bestaande zip (de blijvende
+    kopie van dat jaar) dus altijd intact.
 
     Parameters:
-    - zip_path (str): Pad naar het te controleren ZIP-bestand.
-    - folder_path (str): Map waarin .json-bestanden zich bevinden.
+    - zip_path (str): Pad naar het bij te werken of aan te maken ZIP-bestand.
+    - files (list[tuple[str, str, float]]): De JSON-bestanden van het jaar (zie `_scan_year`).
 
     Returns:
-    - bool:
-        - True als:
-            - het ZIP-bestand niet bestaat, of
-            - één of meer JSON-bestanden in de map nieuwer zijn dan het ZIP-bestand.
-        - False als:
-            - alle JSON-bestanden ouder zijn dan het ZIP-bestand (zip is up-to-date).
-    """
-    if not os.path.exists(zip_path):
-        return True  # Zip bestaat niet → zeker zippen
-
-    zip_mtime = os.path.getmtime(zip_path)
-
-    for root, _, files in os.walk(folder_path):
-        for file in files:
-            if file.endswith(".json"):
-                file_path = os.path.join(root, file)
-                if os.path.getmtime(file_path) > zip_mtime:
-                    return True  # Bestand is recenter dan de zip → zip nodig
-    return False  # Alles is ouder → zip is up-to-date
+    - str: Bestandsnaam van de bijgewerkte zip.
+    """
+    tmp_path = zip_path + ".tmp"
+    if os.path.exists(zip_path):
+        zip_mtime = os.path.getmtime(zip_path)
+        with zipfile.ZipFile(zip_path, 'r') as zipf:
+            existing = set(zipf.namelist())
+        changed = any(arcname in existing and mtime > zip_mtime for _, arcname, mtime in files)
+        if not changed:
+            # Enkel nieuwe bestanden toevoegen, aan een kopie van de bestaande zip
+            shutil.copyfile(zip_path, tmp_path)
+            with zipfile.ZipFile(tmp_path, 'a', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zipf:
+                _write_zip_members(zipf, [(path, arcname) for path, arcname, _ in files if arcname not in existing])
+            os.replace(tmp_path, zip_path)
+            return os.path.basename(zip_path)
+
+    # Volledig (her)opbouwen in een tijdelijk bestand en pas daarna de oude zip vervangen
+    with zipfile.ZipFile(tmp_path, 'w', zipfile.ZIP_DEFLATED, compresslevel=ZIP_COMPRESSLEVEL) as zipf:
+        _write_zip_members(zipf, [(path, arcname) for path, arcname, _ in files])
+    os.replace(tmp_path, zip_path)
+    return os.path.basename(zip_path)
 
 def zip_forecast_data(
     forecast_types: List[str] = ["SolarForecast", "WindForecast"]
@@ -623,7 +893,12 @@ def zip_forecast_data(
     - Bestanden met extensie `.json` worden gebundeld in één zip per jaar.
     - Bestandsstructuur binnen de zip wordt behouden relatief aan het forecasttypepad.
     - Bestaat een zip reeds en is deze up-to-date, dan wordt deze overgeslagen.
+    - Bestaat een zip reeds maar zijn er nieuwe dagen, dan worden enkel die toegevoegd.
+    - De zips worden gelijktijdig aangemaakt (één thread per jaar en type). Het comprimeren
+      gebeurt in zlib, dat de GIL vrijgeeft, zodat meerdere kernen benut worden zonder aparte processen.
     """
+    jobs = []
+
     for forecast_type in forecast_types:
         if forecast_type == "WindForecast":
             type_folder = WIND_FORECAST_DIR
@@ -633,7 +908,7 @@ def zip_forecast_data(
             type_folder = os.path.join(BASE_DIR, forecast_type)
 
         if not os.path.isdir(type_folder):
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -    ⚠️ Map bestaat niet: {type_folder}")
+            print(f"{_ts()} -    ⚠️ Map bestaat niet: {type_folder}")
             continue
 
         for year in os.listdir(type_folder):
@@ -645,22 +920,48 @@ def zip_forecast_data(
             zip_filename = f"{forecast_type}_{year}.zip"
             zip_path = os.path.join(type_folder, zip_filename)
 
-            # Check of zip nodig is
-            if not file_needs_zip(zip_path, year_path):
-                print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -    ⏭️ Up-to-date: {zip_filename}")
+            # Check of zip nodig is: de zip bestaat niet of een JSON-bestand is recenter dan de zip
+            # (één doorloop van de map, die meteen ook de bestandenlijst voor het zippen oplevert)
+            files, max_mtime = _scan_year(type_folder, year_path)
+            if os.path.exists(zip_path) and max_mtime <= os.path.getmtime(zip_path):
+                print(f"{_ts()} -    ⏭️ Up-to-date: {zip_filename}")
                 continue
 
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -    📦 Zippen van {year_path} → {zip_filename}")
+            print(f"{_ts()} -    📦 Zippen van {year_path} → {zip_filename}")
+            jobs.append((zip_path, files))
 
-            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:  # 'w" overschrijft vorig bestand als dit bestaat
-                for root, _, files in os.walk(year_path):
-                    for file in files:
-                        if file.endswith(".json"):
-                            file_path = os.path.join(root, file)
-                            arcname = os.path.relpath(file_path, type_folder)
-                            zipf.write(file_path, arcname)
+    if not jobs:
+        return
+
+    with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+        futures = [executor.submit(_zip_one_year, *job) for job in jobs]
+        for future in as_completed(futures):
+            print(f"{_ts()} -    ✅ Klaar: {future.result()}")
+
+def _get_extracted_names(
+    extract_to: str,
+    top_folders: Set[str]
+) -> Set[str]:
+    """
+    Geef de reeds uitgepakte JSON-bestanden terug, als zip-namen relatief t.o.v. `extract_to`.
 
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -    ✅ Klaar: {zip_filename}")
+    Eén scandir-doorloop per map vervangt een `os.path.exists`-aanroep per bestand in het zipbestand.
+
+    Parameters:
+    - extract_to (str): Doelmap van het uitpakken.
+    - top_folders (set[str]): Bovenste mappen uit het zipbestand (bv. {"2024"}).
+
+    Returns:
+    - set[str]: Relatieve paden met '/' als scheidingsteken, zoals ze in het zipbestand staan.
+    """
+    names: Set[str] = set()
+    for folder in top_folders:
+        folder_path = os.path.join(extract_to, folder)
+        if not os.path.isdir(folder_path):
+            continue
+        for entry in iter_json_files(folder_path):
+            names.add(os.path.relpath(entry.path, extract_to).replace(os.sep, '/'))
+    return names
 
 def unzip_forecast_data(
     zip_path: str,
@@ -675,24 +976,33 @@ def unzip_forecast_data(
 
     Werking:
     - Alleen nieuwe bestanden worden uitgepakt (bestaande worden overgeslagen).
+    - Is het jaar al volledig uitgepakt, dan wordt er meteen gestopt.
     - Herstelt originele modificatietijd (modification time) per bestand.
+    - Print één samenvatting per zipbestand (en niet per uitgepakt bestand).
     """
     if extract_to is None:
         extract_to = os.path.dirname(zip_path)
 
+    extracted = 0
     with zipfile.ZipFile(zip_path, 'r') as zipf:
-        for member in zipf.infolist():
+        members = zipf.infolist()
+        on_disk = _get_extracted_names(extract_to, {m.filename.split('/', 1)[0] for m in members})
+        missing = [m for m in members if m.filename not in on_disk]
+        if not missing:
+            # Jaar is al volledig uitgepakt: niets te doen
+            return
+        for member in missing:
             extracted_path = os.path.join(extract_to, member.filename)
-            if os.path.exists(extracted_path):
-                # Sla bestaande bestanden over
-                continue
             os.makedirs(os.path.dirname(extracted_path), exist_ok=True)
             with zipf.open(member) as source, open(extracted_path, 'wb') as target:
-                shutil.copyfileobj(source, target)
-            # Zet de oorspronkelijke modificatie-tijd terug
-            date_time = time.mktime(member.date_time + (0, 0, -1))
-            os.utime(extracted_path, (date_time, date_time))
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -       ✅ Uitgepakt: {member.filename}")
+                shutil.copyfileobj(source, target, length=1024 * 1024)  # buffer van 1 MB: minder lees-/schrijfaanroepen
+            # Zet de oorspronkelijke modificatie-tijd terug (in nanoseconden, één conversie per bestand)
+            mtime_ns = int(time.mktime(member.date_time + (0, 0, -1))) * 1_000_000_000
+            os.utime(extracted_path, ns=(mtime_ns, mtime_ns))
+            extracted += 1
+
+    if extracted:
+        print(f"{_ts()} -       ✅ Uitgepakt: {extracted}/{len(members)} bestand(en) uit {os.path.basename(zip_path)}")
 
 def unzip_all_forecast_zips(
     forecast_types: List[str] = ["SolarForecast", "WindForecast"]
@@ -706,7 +1016,10 @@ def unzip_all_forecast_zips(
     Werking:
     - Zoekt in elk type-folder naar alle `.zip`-bestanden en roept `unzip_forecast_data()` op.
     - Alleen nieuwe bestanden worden uitgepakt.
+    - De zips worden gelijktijdig uitgepakt (het decomprimeren in zlib geeft de GIL vrij).
     """
+    zip_paths = []
+
     for forecast_type in forecast_types:
         if forecast_type == "WindForecast":
             type_folder = WIND_FORECAST_DIR
@@ -716,14 +1029,17 @@ def unzip_all_forecast_zips(
             type_folder = os.path.join(BASE_DIR, forecast_type)
 
         if not os.path.isdir(type_folder):
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -    ❌ Map niet gevonden: {type_folder}")
+            print(f"{_ts()} -    ❌ Map niet gevonden: {type_folder}")
             continue
 
         for file in os.listdir(type_folder):
             if file.endswith(".zip"):
-                zip_path = os.path.join(type_folder, file)
-                print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -    📦 Bezig met uitpakken: {file}")
-                unzip_forecast_data(zip_path)
+                print(f"{_ts()} -    📦 Bezig met uitpakken: {file}")
+                zip_paths.append(os.path.join(type_folder, file))
+
+    if zip_paths:
+        with ThreadPoolExecutor(max_workers=min(8, len(zip_paths), os.cpu_count() or 1)) as executor:
+            list(executor.map(unzip_forecast_data, zip_paths))
 
     print('')
 
@@ -766,7 +1082,8 @@ def update_data(
     """
     Update wind-, zonne- en/of Belpex-data tussen opgegeven jaartallen.
     Hierbij worden eerste de bestaande zip-bestanden uitgepakt.
-    Vervolgens wordt de recentste data opgehaald bij Elia en Elexys.
+    Vervolgens wordt de recentste data opgehaald bij Elia en Elexys
+    (wind- en zonnedata voor meerdere maanden tegelijk, Belpex-data maand per maand).
     Ten slotte wordt nieuwe data toegevoegd aan de zip-bestanden.
     
     Parameters:
@@ -793,7 +1110,7 @@ def update_data(
 
     # Altijd eerst de huidige bestanden unzippen als er gekozen werd voor 'wind' of 'solar'
     if data_type in ('wind', 'solar', 'all'):
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - 📦 Unzippen van de forecast-data...")
+        print(f"{_ts()} - 📦 Unzippen van de forecast-data...")
         unzip_all_forecast_zips()
 
     # Process map (data_type → functie + label)
@@ -803,32 +1120,92 @@ def update_data(
         "belpex": (import_belpex, "Belpex-data"),
     }
 
-    print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - 📅 Start met ophalen data voor periode {from_year}-{to_year}")
+    print(f"{_ts()} - 📅 Start met ophalen data voor periode {from_year}-{to_year}")
     counter = 0
 
-    # Loop over jaren en maanden
+    # Verzamel alle taken (jaar, maand, functie, label) binnen de beschikbare periode
+    jobs = []
     for year in range(from_year, to_year + 1):
         for month in range(1, 13):
             if (year == latest_available_year and month > latest_available_month) or (year > latest_available_year):
                 continue
 
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -    📅 Ophalen data voor {year}-{month:02d} ({data_type})")
+            print(f"{_ts()} -    📅 Ophalen data voor {year}-{month:02d} ({data_type})")
 
             # Loop over process map
             for dtype, (func, label) in import_funcs.items():
                 if data_type in (dtype, "all"):
+                    jobs.append((year, month, func, label))
+
+    # Wind- en zonnedata zijn onafhankelijk per maand en netwerkgebonden: gelijktijdig ophalen.
+    # Belpex gebruikt Selenium (één gedeelde browser) en blijft daarom sequentieel in de hoofdthread.
+    forecast_jobs = [job for job in jobs if job[2] is not import_belpex]
+    belpex_jobs = [job for job in jobs if job[2] is import_belpex]
+
+    with ThreadPoolExecutor(max_workers=IMPORT_MAX_WORKERS) as executor:
+        futures = {executor.submit(func, year, month): (year, month, label) for year, month, func, label in forecast_jobs}
+
+        # Eén browser voor alle Belpex-maanden, pas gestart als er effectief iets te downloaden valt.
+        # Crasht de browser of wordt de sessie ongeldig (WebDriverException), dan wordt die afgesloten
+        # en de maand één keer opnieuw geprobeerd met een nieuwe browser (die de volgende maanden overneemt).
+        # De (laatste) browser wordt na de laatste maand, ook bij een fout, gesloten.
+        browser = ExitStack()
+        driver = None
+        try:
+            for year, month, func, label in belpex_jobs:
+                try:
+                    if driver is None and not os.path.exists(get_belpex_csv_path(year, month)):
+                        download_dir, _ = prepare_download_dir(BELPEX_DIR)
+                        driver = browser.enter_context(chrome_session(download_dir))
                     try:
-                        func(year, month)
-                        counter += 1
+                        func(year, month, driver=driver)
                     except Exception as e:
-                        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ❌ Fout bij ophalen {label} {year}-{month:02d}: {e}")
+                        if driver is None:
+                            raise
+                        from selenium.common.exceptions import WebDriverException
+                        if not isinstance(e, WebDriverException):
+                            raise
+                        print(f"{_ts()} -    🔁 Browser herstarten na fout: {e}")
+                        browser.close()
+                        driver = None
+                        download_dir, _ = prepare_download_dir(BELPEX_DIR)
+                        driver = browser.enter_context(chrome_session(download_dir))
+                        func(year, month, driver=driver)
+                    counter += 1
+                except Exception as e:
+                    print(f"{_ts()} - ❌ Fout bij ophalen {label} {year}-{month:02d}: {e}")
+        finally:
+            browser.close()
+
+        for future in as_completed(futures):
+            year, month, label = futures[future]
+            try:
+                future.result()
+                counter += 1
+            except Exception as e:
+                print(f"{_ts()} - ❌ Fout bij ophalen {label} {year}-{month:02d}: {e}")
 
     if counter == 0:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} -    ❌ Geen data beschikbaar.")
+        print(f"{_ts()} -    ❌ Geen data beschikbaar.")
 
     # Alleen als 'wind' of 'solar' werd geüpdatet: zip de forecast-data
     if data_type in ('wind', 'solar', 'all'):
-        print(f"\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - 📦 Zippen van de forecast-data...")
+        print(f"\n{_ts()} - 📦 Zippen van de forecast-data...")
         zip_forecast_data()
 
-    print(f"\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ✅ Data-import afgerond.\n")
\ No newline at end of file
+    print(f"\n{_ts()} - ✅ Data-import afgerond.\n")
+
+# ----------- Opdrachtregel -----------
+
+if __name__ == "__main__":
+    # Gebruik (vanuit de projectmap): python -m src.data_import_tools wind 2024 2025
+    # Voor 'wind' en 'solar' wordt Selenium niet geladen, zodat dit ook met pypy3 kan draaien.
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Update wind-, zonne- en/of Belpex-data.")
+    parser.add_argument("data_type", nargs="?", default="all", choices=["wind", "solar", "belpex", "all"])
+    parser.add_argument("from_year", nargs="?", type=int, default=None)
+    parser.add_argument("to_year", nargs="?", type=int, default=None)
+    args = parser.parse_args()
+
+    update_data(args.from_year, args.to_year, args.data_type)
\ No newline at end of file
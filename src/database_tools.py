@@ -7,6 +7,7 @@ Functies:
 - Automatische installatie van vereiste Python-modules.
 - Definitie van SQLAlchemy-modellen voor zonne-energie, windenergie en Belpex-prijzen.
 - Batchgewijs importeren van JSON- en CSV-data naar een SQLite-database.
+- Bijhouden van gematerialiseerde maandtotalen voor snelle overzichten.
 - Automatische parsing en verrijking van datetime-informatie.
 - Selectief verwerken van datasets via het `to_sql()`-commando.
 """
@@ -14,33 +15,95 @@ Functies:
 # ----------- Imports -----------
 
 import os
-import json
 import csv
+import logging
 from datetime import datetime
 import re
-from src.utils.package_tools import update_or_install_if_missing
-from typing import Dict, Any, Optional, List, Type, Literal
+import atexit
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from src.utils.package_tools import ensure_packages
+from src.utils.file_tools import iter_json_files
+from typing import Dict, Any, Optional, List, Tuple, Type, Literal, Iterator
+
+from settings import SKIP_DEP_CHECK
 
 # Controleer en installeer indien nodig de vereiste modules
 # Dit is een vangnet als de gebruiker geen rekening houdt met requirements.txt.
-update_or_install_if_missing("sqlalchemy","2.0.0")
-update_or_install_if_missing("tqdm","4.60.0")
+# In een reeds ingerichte omgeving kan deze controle overgeslagen worden via SKIP_DEP_CHECK=1.
+if not SKIP_DEP_CHECK:
+    # Alle ontbrekende of verouderde packages worden samen in één pip-aanroep geïnstalleerd.
+    ensure_packages({
+        "sqlalchemy": "2.0.0",
+        "tqdm": "4.60.0",
+        "orjson": "3.6.0",
+    })
 
 # Pas na installatie importeren
+import orjson
 from tqdm import tqdm
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, UniqueConstraint, Index, text
-from sqlalchemy.engine import Engine
-from sqlalchemy.orm import declarative_base, sessionmaker, DeclarativeMeta
-from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy import create_engine, event, Column, Integer, String, Float, DateTime, UniqueConstraint, Index, text
+from sqlalchemy.engine import Engine, Connection
+from sqlalchemy.pool import StaticPool
+from sqlalchemy.orm import declarative_base, DeclarativeMeta
 from settings import DB_FILE, SOLAR_FORECAST_DIR, WIND_FORECAST_DIR, BELPEX_DIR
 
+log = logging.getLogger(__name__)
+
 # Database setup:
-# Initialisatie van de SQLite-engine en sessie, met automatische creatie van tabellen op basis van gedefinieerde modellen.
+# Initialisatie van de SQLite-engine, met automatische creatie van tabellen op basis van gedefinieerde modellen.
+# Er is bewust geen ORM-sessie: het importeren schrijft rechtstreeks via een connectie (`engine.begin()`),
+# zonder identity map of flush-administratie per record.
+# SQLite laat slechts één schrijver tegelijk toe: de engine gebruikt daarom één vaste (persistente) connectie
+# in plaats van de standaard QueuePool, zodat extra connecties elkaar niet blokkeren (SQLITE_BUSY).
+# Lezers (bv. data_extraction.py) openen hun eigen connectie en kunnen dankzij WAL parallel blijven lezen.
 Base = declarative_base()
 os.makedirs(os.path.dirname(DB_FILE), exist_ok=True)
-engine = create_engine(f"sqlite:///{DB_FILE}")
-Session = sessionmaker(bind=engine)
-session = Session()
+engine = create_engine(
+    f"sqlite:///{DB_FILE}",
+    poolclass=StaticPool,
+    connect_args={"check_same_thread": False, "timeout": 30.0},
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+    """
+    Stelt de SQLite-PRAGMA's in bij het openen van de (enige) schrijfconnectie.
+
+    - page_size=8192: grotere pagina's voor de lange, sequentiële leesacties. Heeft enkel effect
+      bij een nieuwe (lege) database, vóór de overschakeling naar WAL; bestaande databases behouden hun paginagrootte.
+    - journal_mode=WAL: lezers worden niet geblokkeerd tijdens het schrijven.
+    - synchronous=NORMAL: in WAL-modus veilig bij een crash van het programma, maar zonder fsync bij elke commit.
+    - temp_store=MEMORY, cache_size (ca. 200 MB) en mmap_size (256 MB): minder schijf-I/O bij het
+      importeren en bij het opbouwen van indexen en maandtotalen.
+    - busy_timeout: wacht maximaal 30 seconden op een lock i.p.v. meteen een fout te geven.
+
+    Daarnaast wordt het automatisch starten van transacties door de sqlite3-driver uitgeschakeld;
+    SQLAlchemy start ze zelf via `_begin_transaction`. Zo werken transacties en SAVEPOINTs
+    (`begin_nested`) zoals verwacht, wat nodig is om per jaar in één transactie te importeren.
+    """
+    dbapi_connection.isolation_level = None
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA page_size=8192")
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    cursor.execute("PRAGMA cache_size=-200000")
+    cursor.execute("PRAGMA mmap_size=268435456")
+    cursor.execute("PRAGMA busy_timeout=30000")
+    cursor.close()
+
+@event.listens_for(engine, "begin")
+def _begin_transaction(conn) -> None:
+    """
+    Start een transactie expliciet (zie `_set_sqlite_pragmas`).
+    """
+    conn.exec_driver_sql("BEGIN")
+
+# Geef de persistente connectie pas vrij bij het afsluiten van het proces.
+atexit.register(engine.dispose)
 
 # Abastract model als basis voor SolarData en WindData
 class EnergyBase(Base):
@@ -167,8 +230,63 @@ class BelpexPrice(Base):
         Index('idx_belpex_weekday', 'weekday'),
         Index('idx_belpex_hour', 'hour'),
     )
-# Creëer tabellen op basis van de klassen die afstammen van de klasse Base
-Base.metadata.create_all(engine)
+
+def _build_insert_statement(
+    model: Type[DeclarativeMeta]
+) -> Tuple[str, List[str], List[Tuple[int, Any]]]:
+    """
+    Bouwt één keer het `INSERT OR IGNORE`-statement (als SQL-tekst met ?-parameters) voor een model.
+
+    De batches worden rechtstreeks via `cursor.executemany` van de sqlite3-driver uitgevoerd, zonder
+    dat SQLAlchemy per rij de parameters moet verwerken. Alleen kolommen met een eigen omzetting
+    (zoals DateTime, dat op SQLite als tekst 'YYYY-MM-DD HH:MM:SS.ffffff' bewaard wordt) krijgen
+    dezelfde `bind_processor` als bij een gewone SQLAlchemy-insert, zodat de opgeslagen waarden identiek blijven.
+
+    Parameters:
+    - model (Base): SQLAlchemy-modelklasse.
+
+    Returns:
+    - tuple[str, list[str], list[tuple[int, Callable]]]: SQL-tekst, kolomnamen (in volgorde van de
+      parameters) en (positie, omzetfunctie) voor de kolommen die een omzetting nodig hebben.
+    """
+    columns = [column for column in model.__table__.columns if not column.primary_key]
+    quote = engine.dialect.identifier_preparer.quote
+    sql = (
+        f"INSERT OR IGNORE INTO {model.__tablename__} "
+        f"({', '.join(quote(column.name) for column in columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    processors = [
+        (position, processor)
+        for position, column in enumerate(columns)
+        if (processor := column.type.dialect_impl(engine.dialect).bind_processor(engine.dialect)) is not None
+    ]
+    return sql, [column.name for column in columns], processors
+
+# Vooraf opgebouwde `INSERT OR IGNORE`-statements per model
+INSERT_STATEMENTS = {
+    model: _build_insert_statement(model)
+    for model in (SolarData, WindData, BelpexPrice)
+}
+
+def _to_rows(
+    batch: List[Dict[str, Any]],
+    model: Type[DeclarativeMeta]
+) -> List[Tuple[Any, ...]]:
+    """
+    Zet records (dicts) om naar parametertuples in de kolomvolgorde van `INSERT_STATEMENTS[model]`.
+    Ontbrekende sleutels worden NULL, net zoals bij een insert via SQLAlchemy.
+    """
+    _, names, processors = INSERT_STATEMENTS[model]
+    if not processors:
+        return [tuple([record.get(name) for name in names]) for record in batch]
+    rows = []
+    for record in batch:
+        row = [record.get(name) for name in names]
+        for position, processor in processors:
+            row[position] = processor(row[position])
+        rows.append(tuple(row))
+    return rows
 
 def create_views(
     engine: Engine
@@ -184,6 +302,10 @@ def create_views(
     Als een view al bestaat, wordt deze eerst verwijderd en daarna opnieuw aangemaakt
     met de meest recente definitie.
 
+    De wind- en zonneviews groeperen enkel op datetime: year, month, day, weekday, hour en minute worden
+    bij het importeren uit datetime afgeleid en zijn dus binnen een groep gelijk. Zo kan SQLite de groepen
+    rechtstreeks in de volgorde van de index op datetime aflopen, zonder tijdelijke B-tree om te sorteren.
+
     Parameters:
         engine (sqlalchemy.engine.Engine): De SQLAlchemy-engine die met de database verbonden is.
     """
@@ -194,7 +316,7 @@ def create_views(
                    SUM(measured) AS measured_wind_MW,
                    SUM(monitoredcapacity) AS monitored_wind_MW
             FROM tbl_wind_data
-            GROUP BY datetime, year, month, day, weekday, hour, minute
+            GROUP BY datetime
         """,
 
         "v_wind_offshoreonshore": """
@@ -203,7 +325,7 @@ def create_views(
                    SUM(measured) AS measured_wind_MW,
                    SUM(monitoredcapacity) AS monitored_wind_MW
             FROM tbl_wind_data
-            GROUP BY offshoreonshore, datetime, year, month, day, weekday, hour, minute
+            GROUP BY offshoreonshore, datetime
         """,
 
         "v_solar": """
@@ -211,7 +333,7 @@ def create_views(
                    SUM(measured) AS measured_solar_MW,
                    SUM(monitoredcapacity) AS monitored_solar_MW
             FROM tbl_solar_data
-            GROUP BY datetime, year, month, day, weekday, hour, minute
+            GROUP BY datetime
         """,
 
         "v_belpex": """
@@ -227,7 +349,85 @@ def create_views(
             conn.execute(text(f"CREATE VIEW {name} AS {query}"))
         conn.commit()  # belangrijk bij SQLite om wijzigingen te bewaren
 
-create_views(engine)
+
+def create_monthly_rollups(
+    engine: Engine,
+    refresh: bool = False
+) -> None:
+    """
+    Maakt (of vernieuwt) gematerialiseerde maandtotalen voor wind-, zonne-energie- en Belpex-gegevens.
+
+    De maandelijkse overzichten in data_extraction.py hoeven zo niet telkens alle kwartierwaarden
+    uit de fact-tabellen op te tellen, maar lezen slechts enkele rijen per jaar:
+    - tbl_wind_monthly: windproductie in GWh per offshore/onshore, jaar en maand.
+    - tbl_solar_monthly: zonneproductie in GWh per jaar en maand.
+    - tbl_belpex_monthly: gemiddelde Belpex-prijs in EUR/MWh per jaar en maand.
+
+    Parameters:
+        engine (sqlalchemy.engine.Engine): De SQLAlchemy-engine die met de database verbonden is.
+        refresh (bool): Indien True worden bestaande tabellen eerst verwijderd en opnieuw berekend
+                        (nodig na het toevoegen van nieuwe data). Indien False worden enkel
+                        ontbrekende tabellen aangemaakt.
+    """
+
+    rollups = {
+        "tbl_wind_monthly": ("""
+            SELECT offshoreonshore, year, month, SUM(measured)/4/1000.0 AS total_GWh
+            FROM tbl_wind_data
+            GROUP BY offshoreonshore, year, month
+        """, "offshoreonshore, year, month"),
+
+        "tbl_solar_monthly": ("""
+            SELECT year, month, SUM(measured)/4/1000.0 AS total_GWh
+            FROM tbl_solar_data
+            GROUP BY year, month
+        """, "year, month"),
+
+        "tbl_belpex_monthly": ("""
+            SELECT year, month, AVG(price_eur_per_MWh) AS avg_price
+            FROM tbl_belpex_prices
+            GROUP BY year, month
+        """, "year, month"),
+    }
+
+    with engine.connect() as conn:
+        for name, (query, index_cols) in rollups.items():
+            if refresh:
+                conn.execute(text(f"DROP TABLE IF EXISTS {name}"))
+            conn.execute(text(f"CREATE TABLE IF NOT EXISTS {name} AS {query}"))
+            conn.execute(text(f"CREATE INDEX IF NOT EXISTS idx_{name}_key ON {name} ({index_cols})"))
+        conn.commit()
+
+# Wordt True zodra init_schema() in dit proces uitgevoerd is
+_SCHEMA_READY = False
+# Zorgt ervoor dat gelijktijdige eerste oproepen (vanuit meerdere threads) het schema maar één keer aanmaken
+_SCHEMA_LOCK = threading.Lock()
+
+def init_schema() -> None:
+    """
+    Maakt de tabellen, views en maandtotalen aan (indien nodig), één keer per proces.
+
+    Dit gebeurt niet meer bij het importeren van de module: een import (bv. enkel voor de modellen,
+    of opnieuw in een subproces) raakt de database zo niet aan. `to_sql()` roept deze functie zelf op;
+    alle stappen zijn idempotent (`create_all` en `IF NOT EXISTS`), dus een extra oproep is onschadelijk.
+    Gelijktijdige oproepen vanuit meerdere threads wachten op elkaar (double-checked locking).
+    """
+    global _SCHEMA_READY
+    if _SCHEMA_READY:
+        return
+    with _SCHEMA_LOCK:
+        if _SCHEMA_READY:
+            return
+        # Creëer tabellen op basis van de klassen die afstammen van de klasse Base
+        Base.metadata.create_all(engine)
+        # create_all maakt geen indexen aan op bestaande tabellen: herstel indexen die ontbreken,
+        # bv. na een onderbroken eerste import (zie _secondary_indexes_deferred)
+        for table in Base.metadata.sorted_tables:
+            for index in table.indexes:
+                index.create(engine, checkfirst=True)
+        create_views(engine)
+        create_monthly_rollups(engine)
+        _SCHEMA_READY = True
 
 def parse_record(
     record: Dict[str, Any]
@@ -235,6 +435,9 @@ def parse_record(
     """
     Zet een record om naar het juiste datetime-formaat en voegt datumcomponenten toe.
 
+    Bewust per record: `datetime.fromisoformat` is in C geïmplementeerd en sneller dan een gevectoriseerde
+    `pd.to_datetime` op een batch, omdat die de tijdstempels daarna toch weer naar Python-datetimes moet omzetten.
+
     Parameters:
     - record (dict): Een dictionary met ten minste een 'datetime'-sleutel (ISO-formaat).
 
@@ -254,43 +457,158 @@ def parse_record(
     except Exception as e:
         return None
 
+# Alles behalve cijfers, komma, punt en minteken (bv. het euroteken en spaties in '€ € 24,13').
+# Eén keer gecompileerd i.p.v. bij elke rij via re.sub (en zijn interne cache) opgezocht.
+# Een str.translate-tabel is geen alternatief: die zou ook alle niet-ASCII-tekens moeten opsommen.
+_EURO_CLEANUP_RE = re.compile(r"[^\d,.\-]")
+
+def _parse_belpex_dt(
+    value: str
+) -> datetime:
+    """
+    Zet een Belpex-tijdstempel in het vaste formaat 'dd/mm/jjjj uu:mm:ss' om naar een datetime.
+
+    Het formaat ligt vast, dus de componenten worden rechtstreeks uit de string gesneden;
+    dat is een stuk sneller dan `datetime.strptime`, dat per aanroep het formaat opnieuw interpreteert.
+    Bij een afwijkend formaat wordt alsnog teruggevallen op `strptime`.
+
+    Parameters:
+    - value (str): Tijdstempel zoals in de Belpex-CSV (bv. '31/01/2020 23:00:00').
+
+    Returns:
+    - datetime: De geparste datum en tijd.
+    """
+    if len(value) == 19 and value[2] == "/" and value[5] == "/" and value[13] == ":":
+        return datetime(
+            int(value[6:10]), int(value[3:5]), int(value[0:2]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19])
+        )
+    return datetime.strptime(value, "%d/%m/%Y %H:%M:%S")
+
 def insert_batch(
+    conn: Connection,
     batch: List[Dict[str, Any]],
     model: Type[DeclarativeMeta]
-) -> int:
+) -> Tuple[int, List[Tuple[str, str]]]:
     """
-    Voegt een batch records toe aan de database via een `INSERT OR IGNORE` statement.
+    Voegt een batch records toe aan de database via een `INSERT OR IGNORE` statement (executemany op driverniveau).
+
+    De batch wordt uitgevoerd binnen de lopende transactie van `conn` (de aanroeper commit één keer
+    per jaar of per map i.p.v. na elke batch). Elke batch krijgt een eigen SAVEPOINT, zodat een
+    mislukte batch teruggedraaid kan worden zonder de rest van de transactie te verliezen.
+
+    Fouten worden niet meteen afgedrukt (dat verstoort de tqdm-voortgangsbalk), maar verzameld
+    en teruggegeven zodat de aanroeper ze één keer per jaar kan rapporteren.
 
     Parameters:
+    - conn (Connection): Connectie met een lopende transactie (bv. via `engine.begin()`).
     - batch (list[dict]): Een lijst met dictionaries die overeenkomen met de databasekolommen.
     - model (Base): SQLAlchemy-modelklasse waarin de data wordt opgeslagen.
 
     Returns:
-    - int: Aantal succesvol toegevoegde records.
+    - tuple[int, list[tuple[str, str]]]: Aantal succesvol toegevoegde records en een lijst met (context, foutmelding).
     """
+    errors = []
+    sql = INSERT_STATEMENTS[model][0]
     try:
-        stmt = sqlite_insert(model).prefix_with("OR IGNORE").values(batch)
-        result = session.execute(stmt)
-        session.commit()
-        return result.rowcount
+        with conn.begin_nested():
+            result = conn.exec_driver_sql(sql, _to_rows(batch, model))
+            return result.rowcount, errors
     except Exception as e:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ⚠️ Fout bij batch-insert: {e} — probeer individuele inserts...")
+        errors.append(("batch-insert", f"{e} — individuele inserts uitgevoerd"))
         inserted = 0
+        # Mislukte records worden enkel geteld (met de eerste fout als voorbeeld): bij vervuilde data
+        # zou één foutregel per record de uitvoer (en de rapportering) overspoelen.
+        failed = 0
+        first_error = None
         for record in batch:
             try:
-                stmt = sqlite_insert(model).prefix_with("OR IGNORE").values(**record)
-                result = session.execute(stmt)
+                with conn.begin_nested():
+                    result = conn.exec_driver_sql(sql, _to_rows([record], model)[0])
                 if result.rowcount:
                     inserted += 1
             except Exception as e:
-                print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ⚠️ Individuele insert mislukt: {e}")
-        session.commit()
-        return inserted
+                failed += 1
+                if first_error is None:
+                    first_error = f"{record.get('datetime')}: {e}"
+        if failed:
+            errors.append(("individuele inserts", f"{failed} van {len(batch)} records mislukt (eerste fout: {first_error})"))
+        return inserted, errors
+
+def report_errors(
+    errors: List[Tuple[str, str]],
+    label: str
+) -> None:
+    """
+    Rapporteert de verzamelde fouten in één keer (na de voortgangsbalk), zodat die intact blijft.
+
+    Parameters:
+    - errors (list[tuple[str, str]]): Lijst met (context, foutmelding).
+    - label (str): Omschrijving van de verwerkte dataset (bv. "jaar 2024 van SolarData").
+    """
+    if not errors:
+        return
+    log.warning("⚠️ %d fout(en) bij verwerken van %s:", len(errors), label)
+    for context, message in errors:
+        log.warning("      ⚠️ %s: %s", context, message)
+
+def _load_json_file(
+    filepath: str
+) -> Tuple[Optional[List[Dict[str, Any]]], Optional[str]]:
+    """
+    Leest één JSON-bestand met records in.
+
+    Parameters:
+    - filepath (str): Pad naar het JSON-bestand.
+
+    Returns:
+    - tuple[list[dict] | None, str | None]: De records (een los object wordt een lijst van één record)
+      en None, of None en de foutmelding als het bestand niet ingelezen kon worden.
+    """
+    try:
+        # orjson parseert de bytes rechtstreeks (UTF-8), sneller dan json.load op een tekstbestand
+        with open(filepath, 'rb') as f:
+            records = orjson.loads(f.read())
+        if isinstance(records, dict):
+            records = [records]
+        return records, None
+    except Exception as e:
+        return None, f"fout bij laden van bestand: {e}"
+
+def _iter_json_files_loaded(
+    all_files: List[str],
+    max_workers: int = 8,
+    prefetch: int = 32
+) -> Iterator[Tuple[str, Optional[List[Dict[str, Any]]], Optional[str]]]:
+    """
+    Leest JSON-bestanden in via een kleine threadpool en geeft ze terug in de oorspronkelijke volgorde.
+
+    Het lezen van de bestanden (I/O, zonder GIL) overlapt zo met het verwerken en wegschrijven in de
+    hoofdthread. Er staan hoogstens `prefetch` bestanden tegelijk klaar, zodat het geheugengebruik begrensd blijft.
+
+    Parameters:
+    - all_files (list[str]): Paden naar de JSON-bestanden.
+    - max_workers (int): Aantal leesthreads. Standaard: 8.
+    - prefetch (int): Maximaal aantal vooraf ingelezen bestanden. Standaard: 32.
+
+    Returns:
+    - Iterator[tuple[str, list[dict] | None, str | None]]: Per bestand (pad, records, foutmelding).
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = deque()
+        for filepath in all_files:
+            pending.append((filepath, executor.submit(_load_json_file, filepath)))
+            if len(pending) >= prefetch:
+                done_path, future = pending.popleft()
+                yield (done_path, *future.result())
+        while pending:
+            done_path, future = pending.popleft()
+            yield (done_path, *future.result())
 
 def process_directory(
     path: str,
     model: Type[DeclarativeMeta],
-    batch_size: int = 1000
+    batch_size: int = 10000
 ) -> None:
     """
     Verwerkt alle JSON-bestanden in submappen (per jaar) van een opgegeven map en slaat ze batchgewijs op in de database.
@@ -298,7 +616,8 @@ def process_directory(
     Parameters:
     - path (str): Pad naar de hoofdmap met submappen per jaar.
     - model (Base): SQLAlchemy-model waarin de records moeten worden opgeslagen (bv. SolarData of WindData).
-    - batch_size (int): Aantal records per batch-insert (default = 1000).
+    - batch_size (int): Aantal records per batch-insert (default = 10000). Elke rij is een aparte uitvoering binnen
+      `executemany`, dus de SQLite-limiet op het aantal parameters per statement speelt hier geen rol.
     """
 
     for year_dir in sorted(os.listdir(path)):
@@ -309,97 +628,142 @@ def process_directory(
         if not os.path.isdir(year_path) or not year_dir.isdigit():
             continue
 
-        all_files = [
-            os.path.join(root, f)
-            for root, _, files in os.walk(year_path)
-            for f in files if f.endswith(".json")
-        ]
+        all_files = [entry.path for entry in iter_json_files(year_path)]
 
         batch = []
+        year_errors = []
+
+        log.info("🔄 Start bijwerken jaar %s van %s.", year_dir, model.__name__)
+        # Eén transactie (en dus één commit) per jaar i.p.v. per batch
+        with engine.begin() as conn:
+            for filepath, records, error in tqdm(
+                _iter_json_files_loaded(all_files),
+                total=len(all_files),
+                desc=f"                       Bezig verwerken van {model.__name__} van het jaar {year_dir}"
+            ):
+                if error is not None:
+                    year_errors.append((filepath, error))
+                    continue
 
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - 🔄 Start bijwerken jaar {year_dir} van {model.__name__}.")
-        for filepath in tqdm(all_files, desc=f"                       Bezig verwerken van {model.__name__} van het jaar {year_dir}"):
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    records = json.load(f)
-                    if isinstance(records, dict):
-                        records = [records]
-            except Exception as e:
-                print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ⚠️ Fout bij laden van bestand {filepath}: {e}")
-                continue
+                for record in records:
+                    total_records += 1
+                    parsed = parse_record(record)
+                    if parsed is None:
+                        continue
+                    batch.append(parsed)
 
-            for record in records:
-                total_records += 1
-                parsed = parse_record(record)
-                if parsed is None:
-                    continue
-                batch.append(parsed)
+                    if len(batch) >= batch_size:
+                        inserted, errors = insert_batch(conn, batch, model)
+                        inserted_records += inserted
+                        year_errors.extend(errors)
+                        batch.clear()
 
-                if len(batch) >= batch_size:
-                    inserted_records += insert_batch(batch, model)
-                    batch.clear()
+            if batch:
+                inserted, errors = insert_batch(conn, batch, model)
+                inserted_records += inserted
+                year_errors.extend(errors)
 
-        if batch:
-            inserted_records += insert_batch(batch, model)
+        report_errors(year_errors, f"jaar {year_dir} van {model.__name__}")
 
         if inserted_records > 0:
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ✅ {inserted_records} van {total_records} records van het jaar {year_dir} succesvol toegevoegd aan {model.__tablename__} (duplicaten genegeerd).\n")
+            log.info(
+                "✅ %d van %d records van het jaar %s succesvol toegevoegd aan %s (duplicaten genegeerd).",
+                inserted_records, total_records, year_dir, model.__tablename__
+            )
         else:
-            print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ✅ Jaar {year_dir} van {model.__name__} is bijgewerkt in de database.\n")
+            log.info("✅ Jaar %s van %s is bijgewerkt in de database.", year_dir, model.__name__)
  
 def process_belpex_directory(
     path: str,
-    batch_size: int = 1000
+    batch_size: int = 20000
 ) -> None:
     """
     Doorloopt een directory met CSV-bestanden met Belpex-data en voegt records toe aan de database.
 
     Parameters:
     - path (str): Pad naar de directory met .csv-bestanden.
-    - batch_size (int): Aantal records per batch-insert (default = 1000).
+    - batch_size (int): Aantal records per batch-insert (default = 20000).
     """
     all_files = [os.path.join(path, f) for f in os.listdir(path) if f.endswith(".csv")]
     inserted_records = 0
     total_records = 0
     batch = []
+    all_errors = []
+
+    log.info("🔄 Start bijwerken belpexprijzen.")
+    # Eén transactie (en dus één commit) voor alle Belpex-bestanden i.p.v. per batch
+    with engine.begin() as conn:
+        for filepath in tqdm(all_files, desc=f"                       Bezig verwerken van Belpex-data"):
+            with open(filepath, encoding='iso-8859-1') as csvfile:
+                reader = csv.DictReader(csvfile, delimiter=';')
+                for row in reader:
+                    total_records += 1
+                    try:
+                        dt = _parse_belpex_dt(row["Date"])
+                        euro_raw = row["Euro"]
+                        # Verwijder alles behalve cijfers, komma, punt en minteken
+                        euro_cleaned = _EURO_CLEANUP_RE.sub("", euro_raw)
+                        euro = float(euro_cleaned.replace(",", "."))
+                        record = {
+                            "datetime": dt,
+                            "price_eur_per_MWh": euro,
+                            "day": dt.day,
+                            "month": dt.month,
+                            "year": dt.year,
+                            "hour": dt.hour,
+                            #"minute": dt.minute,
+                            "weekday": dt.isoweekday()
+                        }
+                        batch.append(record)
+                    except Exception as e:
+                        all_errors.append((filepath, f"fout bij record: {e}"))
+
+                    if len(batch) >= batch_size:
+                        inserted, errors = insert_batch(conn, batch, BelpexPrice)
+                        inserted_records += inserted
+                        all_errors.extend(errors)
+                        batch.clear()
 
-    print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - 🔄 Start bijwerken belpexprijzen.")
-    for filepath in tqdm(all_files, desc=f"                       Bezig verwerken van Belpex-data"):
-        with open(filepath, encoding='iso-8859-1') as csvfile:
-            reader = csv.DictReader(csvfile, delimiter=';')
-            for row in reader:
-                total_records += 1
-                try:
-                    dt = datetime.strptime(row["Date"], "%d/%m/%Y %H:%M:%S")
-                    euro_raw = row["Euro"]
-                    # Verwijder alles behalve cijfers, komma, punt en minteken
-                    euro_cleaned = re.sub(r"[^\d,.\-]", "", euro_raw)
-                    euro = float(euro_cleaned.replace(",", "."))
-                    record = {
-                        "datetime": dt,
-                        "price_eur_per_MWh": euro,
-                        "day": dt.day,
-                        "month": dt.month,
-                        "year": dt.year,
-                        "hour": dt.hour,
-                        #"minute": dt.minute,
-                        "weekday": dt.isoweekday()
-                    }
-                    batch.append(record)
-                except Exception as e:
-                    print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ⚠️ Fout bij record in {filepath}: {e}")
-
-                if len(batch) >= batch_size:
-                    inserted_records += insert_batch(batch, BelpexPrice)
-                    batch.clear()
-
-    if batch:
-        inserted_records += insert_batch(batch, BelpexPrice)
+        if batch:
+            inserted, errors = insert_batch(conn, batch, BelpexPrice)
+            inserted_records += inserted
+            all_errors.extend(errors)
+
+    report_errors(all_errors, "Belpex-data")
 
     if inserted_records > 0:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ✅ {inserted_records} van {total_records} Belpex-records toegevoegd (duplicaten genegeerd).\n")
+        log.info("✅ %d van %d Belpex-records toegevoegd (duplicaten genegeerd).", inserted_records, total_records)
     else:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ✅ Belpexprijzen zijn bijgewerkt in de database.\n")
+        log.info("✅ Belpexprijzen zijn bijgewerkt in de database.")
+
+@contextmanager
+def _secondary_indexes_deferred(
+    model: Type[DeclarativeMeta]
+) -> Iterator[None]:
+    """
+    Stelt bij een eerste (volledige) import het opbouwen van de secundaire indexen uit tot na het importeren.
+
+    Zolang de indexen bestaan, moet elke insert ook elke index-B-tree bijwerken. Voor een lege tabel is
+    het sneller om de indexen (`Index` uit `__table_args__`) eerst te verwijderen en na de import in één
+    keer opnieuw op te bouwen. De UNIQUE-constraint blijft altijd behouden (nodig voor `INSERT OR IGNORE`).
+    Bij een tabel die al data bevat (gewone update met enkele nieuwe dagen) gebeurt er niets: het opnieuw
+    opbouwen van de indexen zou dan meer kosten dan het bijwerken ervan.
+
+    Parameters:
+    - model (Base): SQLAlchemy-model waarvan de indexen (tijdelijk) verwijderd worden.
+    """
+    with engine.connect() as conn:
+        is_empty = conn.exec_driver_sql(f"SELECT 1 FROM {model.__tablename__} LIMIT 1").first() is None
+
+    indexes = list(model.__table__.indexes) if is_empty else []
+    for index in indexes:
+        index.drop(engine, checkfirst=True)
+    try:
+        yield
+    finally:
+        # Indexen altijd opnieuw aanmaken, ook als de import mislukt
+        for index in indexes:
+            index.create(engine, checkfirst=True)
 
 def to_sql(
     data_type: Literal["solar", "wind", "belpex", "all"] = "all"
@@ -424,25 +788,30 @@ def to_sql(
     }
 
     try:
+        init_schema()
         types = DATASETS.keys() if data_type == "all" else [data_type]
         for t in types:
             if t not in DATASETS:
-                print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ⚠️ Onbekend datatype: {t}")
+                log.warning("⚠️ Onbekend datatype: %s", t)
                 continue
 
             path, model, func, label = DATASETS[t]
             try:
-                if func == process_directory:
-                    func(path, model)
-                else:
-                    func(path)
+                with _secondary_indexes_deferred(model):
+                    if func == process_directory:
+                        func(path, model)
+                    else:
+                        func(path)
             except Exception as e:
-                print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ❌ Fout bij verwerken data {label}: {e}")
+                log.error("❌ Fout bij verwerken data %s: %s", label, e)
+
+        # Maandtotalen herberekenen op basis van de bijgewerkte tabellen
+        create_monthly_rollups(engine, refresh=True)
+        log.info("✅ Maandtotalen bijgewerkt.")
     except KeyboardInterrupt:
-        print(f"\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - 🛑 Script onderbroken door gebruiker.")
+        log.warning("🛑 Script onderbroken door gebruiker.")
     except Exception as e:
-        print(f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - ❌ Onverwachte fout: {e}")
+        log.error("❌ Onverwachte fout: %s", e)
     finally:
-        session.close()
-        engine.dispose()
-        print(f"\n{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - 🔒 Databaseverbinding correct afgesloten.\n")
\ No newline at end of file
+        # De persistente connectie blijft open voor volgende aanroepen; ze wordt pas bij het afsluiten van Python vrijgegeven.
+        log.info("🔒 Verwerking naar de database afgerond.")
\ No newline at end of file
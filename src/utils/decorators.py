@@ -8,13 +8,17 @@ Deze module bevat momenteel:
 - retry_on_failure: een decorator die functies automatisch opnieuw probeert uit te voeren
   bij tijdelijke fouten, met configureerbare parameters voor aantal pogingen, wachttijd,
   exponentiële backoff en toegestane uitzonderingen.
+- cache_per_version: een decorator die resultaten bewaart zolang een opgegeven "versie"
+  (bv. de wijzigingstijd van een databasebestand) niet verandert.
 
 In de toekomst kunnen hier meer decorators toegevoegd worden.
 """
 
 import functools
+import random
+import threading
 import time
-from typing import Callable, Tuple, Type, Any
+from typing import Callable, Tuple, Type, Any, Dict, Hashable
 
 def retry_on_failure(
     tries: int = 3,
@@ -31,8 +35,10 @@ def retry_on_failure(
     Deze decorator is nuttig bij tijdelijke fouten, zoals netwerkproblemen of onstabiele API-responses.
     Als de gedecoreerde functie een uitzondering genereert die voorkomt in `allowed_exceptions`, 
     zal ze automatisch opnieuw uitgevoerd worden tot het maximum aantal `tries` is bereikt.
-    Tussen elke poging wacht de functie `delay` seconden. Na elke fout wordt de wachttijd vermenigvuldigd 
+    Tussen elke poging wacht de functie ongeveer `delay` seconden. Na elke fout wordt de wachttijd vermenigvuldigd 
     met `backoff` (exponentiële backoff).
+    De effectieve wachttijd krijgt een willekeurige spreiding (jitter) tussen 0,5 en 1,5 keer de berekende wachttijd,
+    zodat gelijktijdige aanroepen (bv. vanuit meerdere threads) niet allemaal op hetzelfde moment opnieuw proberen.
 
     Parameters:
     - tries (int): Het maximaal aantal pogingen voor de functie wordt opgegeven. Standaard: 3.
@@ -64,17 +70,79 @@ def retry_on_failure(
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             # Lokale kopieën maken om te vermijden dat de originele decorator-argumenten 
             # gewijzigd worden tijdens herhaalde pogingen
-            _tries, _delay = tries, delay
-            while _tries > 1:
+            _tries, _delay = max(tries, 1), delay
+            for attempt in range(1, _tries + 1):
                 try:
                     return func(*args, **kwargs)
                 except allowed_exceptions as e:
-                    _tries -= 1
-                    print(f"⚠️ Fout '{e}' in {func.__name__}(). Nog {_tries} pogingen over... Wacht {_delay:.1f}s.")
-                    # Wacht voor het opgegeven aantal seconden
-                    time.sleep(_delay)
+                    # Laatste poging: de uitzondering wordt doorgegeven
+                    if attempt == _tries:
+                        raise
+                    wait = _delay * random.uniform(0.5, 1.5)
+                    print(f"⚠️ Fout '{e}' in {func.__name__}(). Nog {_tries - attempt} pogingen over... Wacht {wait:.1f}s.")
+                    time.sleep(wait)
                     _delay *= backoff
-            # Laatste poging buiten de while-loop: als deze ook faalt, wordt de uitzondering doorgegeven
-            return func(*args, **kwargs)
         return wrapper
-    return decorator
\ No newline at end of file
+    return decorator
+
+def cache_per_version(
+    version_func: Callable[[], Hashable],
+    maxsize: int = 8
+) -> Callable[
+        [Callable[..., Any]],
+        Callable[..., Any]
+    ]:
+    """
+    Decorator die het resultaat van een functie bewaart per combinatie van argumenten én "versie".
+
+    Bij elke oproep wordt eerst `version_func()` uitgevoerd (bv. de wijzigingstijd van een databasebestand).
+    Zolang die versie en de argumenten gelijk blijven, wordt het bewaarde resultaat teruggegeven zonder
+    de functie opnieuw uit te voeren. Verandert de versie, dan wordt het resultaat opnieuw berekend.
+
+    - Resultaten die None zijn (bv. bij een fout) worden niet bewaard.
+    - Heeft het resultaat een `.copy()`-methode (zoals een pandas DataFrame), dan wordt een kopie
+      teruggegeven, zodat de aanroeper het bewaarde resultaat niet per ongeluk kan wijzigen.
+    - Er worden maximaal `maxsize` resultaten bewaard; de oudste worden eerst verwijderd.
+    - De cache is thread-safe; gelijktijdige oproepen met dezelfde sleutel kunnen wel elk de functie uitvoeren.
+
+    Parameters:
+    - version_func (Callable[[], Hashable]): Functie zonder argumenten die de huidige versie teruggeeft.
+    - maxsize (int): Maximaal aantal bewaarde resultaten. Standaard: 8.
+
+    Returns:
+    - Callable[[Callable[..., Any]], Callable[..., Any]]: De decorator.
+
+    Gebruik:
+    @cache_per_version(lambda: os.path.getmtime("data.sqlite"))
+    def load_data():
+        ...
+    """
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        cache: Dict[Hashable, Any] = {}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (version_func(), args, tuple(sorted(kwargs.items())))
+            with lock:
+                result = cache.get(key)
+            if result is None:
+                # De functie zelf wordt buiten de lock uitgevoerd, zodat andere sleutels niet moeten wachten
+                result = func(*args, **kwargs)
+                if result is None:
+                    return None
+                with lock:
+                    cache[key] = result
+                    # Oudste resultaten verwijderen (dicts behouden de invoegvolgorde)
+                    while len(cache) > maxsize:
+                        del cache[next(iter(cache))]
+            return result.copy() if hasattr(result, "copy") else result
+
+        def cache_clear() -> None:
+            with lock:
+                cache.clear()
+
+        # Maakt het mogelijk om de cache handmatig leeg te maken
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
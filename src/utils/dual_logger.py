@@ -1,7 +1,7 @@
 """
 dual_logger.py
 
-Bevat de klasse DualLogger, die zowel sys.stdout als sys.stderr tijdelijk omleidt zodat alle uitvoer (print-statements en foutmeldingen) gelijktijdig naar de console én naar een opgegeven logbestand worden geschreven. De klasse kan gebruikt worden als contextmanager (met `with`) of als losse instantie (met handmatige .close()).
+Bevat de klasse DualLogger, die zowel sys.stdout als sys.stderr tijdelijk omleidt zodat alle uitvoer (print-statements en foutmeldingen) gelijktijdig naar de console én naar een opgegeven logbestand worden geschreven. De klasse wordt bij voorkeur gebruikt als contextmanager (met `with`); als losse instantie moet .close() altijd handmatig aangeroepen worden.
 """
 import sys
 
@@ -11,9 +11,13 @@ class DualLogger:
     tegelijkertijd naar de console én naar een logbestand geschreven wordt.
 
     Deze klasse werkt zowel als:
-    - Contextmanager: gebruik `with DualLogger(path):` om automatisch stdout/stderr te vervangen
-                      en het logbestand na afloop veilig te sluiten.
+    - Contextmanager (aanbevolen): gebruik `with DualLogger(path):` om automatisch stdout/stderr te vervangen
+                      en het logbestand na afloop veilig te sluiten, ook bij een fout.
     - Losse instantie: roep `logger = DualLogger(path)` aan, en vergeet `logger.close()` niet.
+                      Er is bewust geen __del__: het herstellen van de streams tijdens garbage collection
+                      of bij het afsluiten van de interpreter is onbetrouwbaar.
+
+    Het logbestand wordt gebufferd geschreven (64 KB); de buffer wordt geleegd bij flush() en close().
 
     Parameters:
     - logfile_path (str): Volledig pad naar het logbestand (zal geopend worden in append-modus).
@@ -33,9 +37,9 @@ class DualLogger:
     """
 
     def __init__(self, logfile_path):
-        # Sla pad op en open het logbestand (append-modus, UTF-8)
+        # Sla pad op en open het logbestand (append-modus, UTF-8, met ruime schrijfbuffer)
         self.logfile_path = str(logfile_path)
-        self.log = open(self.logfile_path, "a", encoding="utf-8", errors="replace")
+        self.log = open(self.logfile_path, "a", encoding="utf-8", errors="replace", buffering=65536)
 
         # Bewaar originele standaard streams om later te kunnen herstellen
         self.original_stdout = sys.stdout
@@ -76,20 +80,3 @@ class DualLogger:
         sys.stderr = self.original_stderr
         # Sluit het logbestand
         self.log.close()
-
-    def __del__(self):
-        # Herstel standaard streams indien nog actief
-        try:
-            if sys.stdout is self:
-                sys.stdout = self.original_stdout
-            if sys.stderr is self:
-                sys.stderr = self.original_stderr
-        except Exception:
-            pass  # Tijdens interpreter shutdown kunnen globals verdwijnen
-
-        # Probeer logbestand te sluiten indien nog open
-        try:
-            if hasattr(self, "log") and not self.log.closed:
-                self.log.close()
-        except Exception:
-            pass  # Stilletjes falen indien iets misloopt bij garbage collection
\ No newline at end of file
@@ -0,0 +1,40 @@
+"""
+file_tools.py
+
+Hulpfuncties voor het doorlopen van de datamappen.
+
+Deze module bevat momenteel:
+
+- iter_json_files: overloopt recursief alle .json-bestanden onder een map via `os.scandir`.
+
+Voorbeeld:
+    from src.utils.file_tools import iter_json_files
+
+    paths = [entry.path for entry in iter_json_files("Data/SolarForecast/2025")]
+"""
+
+import os
+from typing import Iterator
+
+def iter_json_files(
+    path: str
+) -> Iterator[os.DirEntry]:
+    """
+    Overloop recursief alle .json-bestanden onder een map via `os.scandir`.
+
+    De DirEntry-objecten bevatten al de naam en het volledige pad (geen `os.path.join` per bestand)
+    en bewaren het resultaat van `.stat()` na de eerste aanroep, zodat er per bestand hoogstens
+    één stat-aanroep nodig is.
+
+    Parameters:
+    - path (str): Map die doorzocht wordt.
+
+    Returns:
+    - Iterator[os.DirEntry]: De gevonden JSON-bestanden.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_json_files(entry.path)
+            elif entry.name.endswith(".json"):
+                yield entry
@@ -9,7 +9,15 @@ Structuur:
     TRANSLATIONS   → Tekstlabels en grafiektitels per taal
     MONTHS         → Maandnamen (kort & voluit)
     WEEKDAYS       → Weekdagnamen (kort & voluit)
-    Helperfuncties → Naamopvraging per nummer of datetime-object
+    MONTH_TABLES   → Maandnamen als tuple per (taal, kort), te indexeren met het maandnummer
+    WEEKDAY_TABLES → Weekdagnamen als tuple per (taal, kort), te indexeren met het weekdagnummer
+    Helperfuncties → Naamopvraging per nummer of datetime-object, of gevectoriseerd voor een hele kolom
+
+Prestaties:
+    Het opzoeken van een naam is puur geheugenwerk (een paar dict- en tuple-lookups, geen rekenwerk).
+    Winst zit dus enkel in minder Python-aanroepen: herhaalde oproepen worden bediend door lru_cache,
+    en voor hele kolommen gebruik je months_from_series/weekdays_from_series (één numpy-take).
+    Verdere micro-optimalisaties van de tabellen zelf leveren in de praktijk niets meetbaars op.
 
 Gebruik:
     from src.utils.localization import (
@@ -17,9 +25,13 @@ Gebruik:
         get_weekday_name, 
         get_month_name_from_date,
         get_weekday_name_from_date,
+        months_from_series,
+        weekdays_from_series,
         TRANSLATIONS, 
         MONTHS, 
-        WEEKDAYS
+        WEEKDAYS,
+        MONTH_TABLES,
+        WEEKDAY_TABLES
     )
 
 Voorbeelden:
@@ -37,7 +49,12 @@ Voorbeelden:
 """
 
 from datetime import datetime
-from typing import Literal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Literal, Mapping, Sequence, Union
+
+import numpy as np
+import pandas as pd
 
 # Type voor taalcode: momenteel beperkt tot Nederlands, Frans of Engels
 LangCode = Literal["nl", "fr", "en"]
@@ -367,10 +384,65 @@ WEEKDAYS = {
     }
 }
 
+# -------------------------------------------------------------------
+# Platte opzoektabellen
+# -------------------------------------------------------------------
+# Eén tuple per (taal, kort) i.p.v. geneste dicts: index 0 is leeg, zodat het maand- of
+# weekdagnummer rechtstreeks als index gebruikt kan worden (bv. MONTH_TABLES[("nl", True)][3] → 'Mrt').
+# MONTHS en WEEKDAYS blijven de bron; de tabellen worden er bij het laden van de module uit opgebouwd.
+MONTH_TABLES = {
+    (lang, short): ("",) + tuple(names["short" if short else "full"][i] for i in range(1, 13))
+    for lang, names in MONTHS.items()
+    for short in (True, False)
+}
+WEEKDAY_TABLES = {
+    (lang, short): ("",) + tuple(names["short" if short else "full"][i] for i in range(1, 8))
+    for lang, names in WEEKDAYS.items()
+    for short in (True, False)
+}
+
+# Dezelfde tabellen als NumPy-arrays (object), voor het opzoeken van een hele kolom in één `take`.
+# Index 0 bevat hier 'Onbekend', zodat ongeldige nummers daarnaar omgeleid kunnen worden.
+_MONTH_ARRAYS = {key: np.array(("Onbekend",) + names[1:], dtype=object) for key, names in MONTH_TABLES.items()}
+_WEEKDAY_ARRAYS = {key: np.array(("Onbekend",) + names[1:], dtype=object) for key, names in WEEKDAY_TABLES.items()}
+
+# -------------------------------------------------------------------
+# Alleen-lezen maken
+# -------------------------------------------------------------------
+def _freeze(obj: Any) -> Any:
+    """
+    Zet een (geneste) dict recursief om naar een alleen-lezen `MappingProxyType`.
+
+    Lezen werkt zoals bij een gewone dict (`[...]`, `.get`, `in`, iteratie), maar per ongeluk
+    wijzigen (bv. een vertaling overschrijven in een notebook) geeft een TypeError i.p.v.
+    stilletjes alle volgende grafieken en de gecachete namen te beïnvloeden.
+
+    Args:
+        obj (Any): Een dict (eventueel genest) of een bladwaarde
+
+    Returns:
+        Any: Een MappingProxyType voor dicts, anders de waarde zelf
+    """
+    if isinstance(obj, dict):
+        return MappingProxyType({key: _freeze(value) for key, value in obj.items()})
+    return obj
+
+TRANSLATIONS: Mapping[str, Any] = _freeze(TRANSLATIONS)
+MONTHS: Mapping[str, Any] = _freeze(MONTHS)
+WEEKDAYS: Mapping[str, Any] = _freeze(WEEKDAYS)
+MONTH_TABLES: Mapping[tuple, tuple] = _freeze(MONTH_TABLES)
+WEEKDAY_TABLES: Mapping[tuple, tuple] = _freeze(WEEKDAY_TABLES)
+for _table in (*_MONTH_ARRAYS.values(), *_WEEKDAY_ARRAYS.values()):
+    _table.flags.writeable = False
+del _table
+
 # -------------------------------------------------------------------
 # Helperfuncties
 # -------------------------------------------------------------------
 
+# Beide functies zijn puur met een klein, eindig domein (12 maanden / 7 weekdagen x 3 talen x kort/voluit):
+# herhaalde oproepen (bv. per rij bij het opmaken van grafieklabels) worden uit de cache beantwoord.
+@lru_cache(maxsize=256)
 def get_month_name(month_number: int, lang: LangCode = "nl", short: bool = True) -> str:
     """
     Geeft de maandnaam terug op basis van maandnummer (1-12).
@@ -383,10 +455,15 @@ def get_month_name(month_number: int, lang: LangCode = "nl", short: bool = True)
     Returns:
         str: Maandnaam in de gevraagde taal
     """
-    style = "short" if short else "full"
-    return MONTHS.get(lang, MONTHS["nl"])[style].get(month_number, "Onbekend")
+    table = MONTH_TABLES.get((lang, short)) or MONTH_TABLES[("nl", short)]
+    try:
+        return table[month_number] if 1 <= month_number <= 12 else "Onbekend"
+    except TypeError:
+        # Geen geheel getal (bv. 3.0 uit een float-kolom): zelfde resultaat als een opzoeking in MONTHS
+        return MONTHS.get(lang, MONTHS["nl"])["short" if short else "full"].get(month_number, "Onbekend")
 
 
+@lru_cache(maxsize=256)
 def get_weekday_name(weekday_number: int, lang: LangCode = "nl", short: bool = True) -> str:
     """
     Geeft de weekdag terug op basis van nummer (1 = maandag, 7 = zondag).
@@ -399,8 +476,12 @@ def get_weekday_name(weekday_number: int, lang: LangCode = "nl", short: bool = T
     Returns:
         str: Weekdagnaam in de gevraagde taal
     """
-    style = "short" if short else "full"
-    return WEEKDAYS.get(lang, WEEKDAYS["nl"])[style].get(weekday_number, "Onbekend")
+    table = WEEKDAY_TABLES.get((lang, short)) or WEEKDAY_TABLES[("nl", short)]
+    try:
+        return table[weekday_number] if 1 <= weekday_number <= 7 else "Onbekend"
+    except TypeError:
+        # Geen geheel getal (bv. 5.0 uit een float-kolom): zelfde resultaat als een opzoeking in WEEKDAYS
+        return WEEKDAYS.get(lang, WEEKDAYS["nl"])["short" if short else "full"].get(weekday_number, "Onbekend")
 
 
 def get_month_name_from_date(date_obj: datetime, lang: LangCode = "nl", short: bool = True) -> str:
@@ -415,7 +496,9 @@ def get_month_name_from_date(date_obj: datetime, lang: LangCode = "nl", short: b
     Returns:
         str: Maandnaam
     """
-    return get_month_name(date_obj.month, lang, short)
+    # Rechtstreeks in de tabel: het maandnummer van een datum ligt altijd tussen 1 en 12
+    table = MONTH_TABLES.get((lang, short)) or MONTH_TABLES[("nl", short)]
+    return table[date_obj.month]
 
 
 def get_weekday_name_from_date(date_obj: datetime, lang: LangCode = "nl", short: bool = True) -> str:
@@ -430,5 +513,79 @@ def get_weekday_name_from_date(date_obj: datetime, lang: LangCode = "nl", short:
     Returns:
         str: Weekdagnaam
     """
-    weekday = date_obj.isoweekday()  # maandag = 1, zondag = 7
-    return get_weekday_name(weekday, lang, short)
\ No newline at end of file
+    table = WEEKDAY_TABLES.get((lang, short)) or WEEKDAY_TABLES[("nl", short)]
+    return table[date_obj.isoweekday()]  # maandag = 1, zondag = 7
+
+
+def _names_from_numbers(
+    numbers: Union[pd.Series, np.ndarray, Sequence[int]],
+    arrays: dict,
+    lang: LangCode,
+    short: bool
+) -> np.ndarray:
+    """
+    Zet een reeks nummers in één keer om naar namen via de opgegeven opzoekarrays.
+
+    Args:
+        numbers (Series | ndarray | Sequence[int]): Maand- of weekdagnummers
+        arrays (dict): `_MONTH_ARRAYS` of `_WEEKDAY_ARRAYS`
+        lang (str): 'nl', 'fr' of 'en'
+        short (bool): Korte of volledige namen
+
+    Returns:
+        np.ndarray: Namen (dtype object); 'Onbekend' voor ongeldige nummers
+    """
+    table = arrays.get((lang, short))
+    if table is None:
+        table = arrays[("nl", short)]
+    values = np.asarray(numbers)
+    if values.dtype.kind not in "iu":
+        # Geen gehele getallen (bv. float door ontbrekende waarden): per element, met dezelfde regels als de scalaire functies
+        lookup = get_month_name if arrays is _MONTH_ARRAYS else get_weekday_name
+        return np.array([lookup(value, lang, short) for value in values.tolist()], dtype=object)
+    valid = (values >= 1) & (values < len(table))
+    return table.take(np.where(valid, values, 0))
+
+
+def months_from_series(
+    months: Union[pd.Series, np.ndarray, Sequence[int]],
+    lang: LangCode = "nl",
+    short: bool = True
+) -> np.ndarray:
+    """
+    Gevectoriseerde versie van `get_month_name` voor een hele kolom maandnummers.
+
+    In plaats van één Python-oproep per rij gebeurt het opzoeken in één `np.take` op een vaste tabel.
+
+    Args:
+        months (Series | ndarray | Sequence[int]): Maandnummers (1 t/m 12)
+        lang (str): 'nl', 'fr' of 'en'
+        short (bool): Korte (default) of volledige naam
+
+    Returns:
+        np.ndarray: Maandnamen in de gevraagde taal ('Onbekend' voor ongeldige nummers)
+
+    Voorbeeld:
+        >>> months_from_series(pd.Series([1, 3, 12]), lang="nl")
+        array(['Jan', 'Mrt', 'Dec'], dtype=object)
+    """
+    return _names_from_numbers(months, _MONTH_ARRAYS, lang, short)
+
+
+def weekdays_from_series(
+    weekdays: Union[pd.Series, np.ndarray, Sequence[int]],
+    lang: LangCode = "nl",
+    short: bool = True
+) -> np.ndarray:
+    """
+    Gevectoriseerde versie van `get_weekday_name` voor een hele kolom weekdagnummers (1 = maandag, 7 = zondag).
+
+    Args:
+        weekdays (Series | ndarray | Sequence[int]): Weekdagnummers (1-7)
+        lang (str): 'nl', 'fr' of 'en'
+        short (bool): Korte (default) of volledige naam
+
+    Returns:
+        np.ndarray: Weekdagnamen in de gevraagde taal ('Onbekend' voor ongeldige nummers)
+    """
+    return _names_from_numbers(weekdays, _WEEKDAY_ARRAYS, lang, short)
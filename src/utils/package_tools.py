@@ -10,15 +10,157 @@ Momenteel bevat deze module:
 - update_or_install_if_missing(package_name, min_version=None):
     Installeert of upgrade een package indien het ontbreekt of de versie
     niet aan de minimumvereiste voldoet, en importeert het daarna.
+- ensure_packages(requirements):
+    Idem voor meerdere packages tegelijk, met hoogstens één pip-aanroep voor alle ontbrekende
+    of verouderde packages samen.
 """
 
 import importlib
+import importlib.metadata
 import importlib.util
 import subprocess
 import sys
-from typing import Optional
+from typing import Dict, Optional, Tuple
 import types
 
+# packaging vergelijkt versies volgens PEP 440 (bv. '2.10.0rc1' of '1.26.4.post1').
+# Deze module moet ook werken vóór de vereisten geïnstalleerd zijn: zonder packaging wordt
+# teruggevallen op een eenvoudige numerieke vergelijking.
+try:
+    from packaging.version import Version, InvalidVersion
+except ImportError:  # pragma: no cover - afhankelijk van de omgeving
+    Version = None
+
+# Reeds gecontroleerde packages per (naam, minimumversie): herhaalde oproepen (vanuit meerdere modules)
+# geven meteen het module-object terug zonder opnieuw de versie te controleren.
+_CHECKED: Dict[Tuple[str, Optional[str]], types.ModuleType] = {}
+
+def _parse_version(v: str, width: Optional[int] = None) -> list[int]:
+    """
+    Zet een versie-string (bv. '2.10.3' of '2.25.0.1') om naar een lijst van gehele getallen.
+    Indien 'width' is opgegeven, wordt de lijst opgevuld tot die lengte met nullen.
+    Als 'width' None is, wordt de ruwe lijst teruggegeven.
+
+    Parameters:
+    - v (str): Versie als string (bv. '2.10.3').
+    - width (int or None): Minimale lengte van de resulterende lijst (aangevuld met nullen indien nodig).
+
+    Returns:
+    - list[int]: Lijst van gehele getallen.
+
+    Raises:
+    - ValueError: Als een deel van de versie geen geheel getal is (bv. '2.10a1').
+    """
+    parts = v.split('.')
+    int_parts = []
+    for p in parts:
+        if not p.isdigit():
+            raise ValueError(f"Niet-numeriek versieonderdeel: '{p}'")
+        int_parts.append(int(p))
+    if width:
+        return int_parts + [0] * (width - len(int_parts))
+    return int_parts
+
+def _is_version_at_least(current: str, minimum: str) -> bool:
+    """
+    Vergelijkt twee versie-strings volgens PEP 440 (via `packaging.version`), zodat ook versies
+    met een suffix (bv. '2.10.0rc1') correct vergeleken worden en geen onnodige pip-installatie uitlokken.
+    Is packaging niet beschikbaar, dan wordt vergeleken op basis van de numerieke onderdelen;
+    de kortere lijst wordt dan opgevuld met nullen zodat beide even lang zijn.
+
+    Parameters:
+    - current (str): Huidige geïnstalleerde versie.
+    - minimum (str): Vereiste minimumversie.
+
+    Returns:
+    - bool: True als current >= minimum, anders False.
+            Geeft ook False terug als de versie niet vergeleken kan worden.
+    """
+    if Version is not None:
+        try:
+            return Version(current) >= Version(minimum)
+        except InvalidVersion as e:
+            print(f"⚠️  Versie '{current}' is niet vergelijkbaar ({e}) → installeren/upgrade vereist")
+            return False
+    try:
+        current_parts = _parse_version(current)
+        minimum_parts = _parse_version(minimum)
+        max_len = max(len(current_parts), len(minimum_parts))
+        current_parts += [0] * (max_len - len(current_parts))
+        minimum_parts += [0] * (max_len - len(minimum_parts))
+        return current_parts >= minimum_parts
+    except ValueError as e:
+        print(f"⚠️  Versie '{current}' is niet numeriek vergelijkbaar ({e}) → installeren/upgrade vereist")
+        return False
+
+def _pip_target_if_needed(
+    package_name: str,
+    min_version: Optional[str]
+) -> Optional[str]:
+    """
+    Controleert of een package ontbreekt of verouderd is, zonder het te importeren.
+
+    Parameters:
+    - package_name (str): Naam van het package zoals op PyPI (bv. 'requests').
+    - min_version (str, optional): Minimale vereiste versie, of None voor geen versiecontrole.
+
+    Returns:
+    - str | None: Het pip-argument (bv. 'requests>=2.25.0') als installeren of upgraden nodig is, anders None.
+    """
+    pip_target = f"{package_name}>={min_version}" if min_version else package_name
+
+    # Controleer of het package al aanwezig is
+    if importlib.util.find_spec(package_name) is None:
+        print(f"📦 Module '{package_name}' niet gevonden. Bezig met installeren...")
+        return pip_target
+    if not min_version:
+        return None
+
+    # Package is reeds aanwezig → controleer de huidige versie via de metadata (zonder import)
+    try:
+        current_version = importlib.metadata.version(package_name)
+    except importlib.metadata.PackageNotFoundError:
+        # Importnaam wijkt af van de distributienaam: versie via het module-attribuut (default = '0.0.0')
+        current_version = getattr(importlib.import_module(package_name), "__version__", "0.0.0")
+
+    if _is_version_at_least(current_version, min_version):
+        return None
+    print(f"🔁 Upgrade nodig: {package_name} ({current_version} < {min_version})")
+    return pip_target
+
+def _import_checked(
+    package_name: str,
+    min_version: Optional[str],
+    installed: bool
+) -> types.ModuleType:
+    """
+    Importeert een (eventueel net geïnstalleerd) package en bewaart het resultaat in de cache.
+
+    Parameters:
+    - package_name (str): Naam van het package.
+    - min_version (str, optional): Minimale vereiste versie (deel van de cachesleutel).
+    - installed (bool): True als het package net geïnstalleerd of geüpgraded werd.
+
+    Returns:
+    - module: Het geïmporteerde package-object.
+    """
+    if installed:
+        # Verwijder het package en submodules uit sys.modules om herladen mogelijk te maken
+        to_delete = [mod for mod in sys.modules if mod == package_name or mod.startswith(package_name + ".")]
+        for mod in to_delete:
+            del sys.modules[mod]
+        importlib.invalidate_caches()
+
+    module = importlib.import_module(package_name)
+
+    # Toon geïnstalleerde of geüpgradede versie indien herladen
+    if installed:
+        version = getattr(module, "__version__", "onbekend")
+        print(f"✅ Module '{package_name}' geïnstalleerd (versie {version}).")
+
+    _CHECKED[(package_name, min_version)] = module
+    return module
+
 def update_or_install_if_missing(
     package_name: str,
     min_version: Optional[str] = None
@@ -28,8 +170,13 @@ def update_or_install_if_missing(
     dat het voldoet aan een minimale versie.
 
     - Installeert het package als het nog niet aanwezig is.
-    - Voert een upgrade uit als de aanwezige versie te laag is of niet numeriek vergelijkbaar is.
+    - Voert een upgrade uit als de aanwezige versie te laag is of niet vergelijkbaar is.
     - Herlaadt het package na installatie of upgrade, zodat het meteen bruikbaar is.
+    - De versie wordt gelezen uit de geïnstalleerde metadata (`importlib.metadata`), zonder het package
+      eerst te importeren; zo wordt bij een upgrade niet eerst de oude versie ingeladen.
+    - Het resultaat wordt per (package, minimumversie) bewaard voor de rest van het proces.
+
+    Voor meerdere packages tegelijk is `ensure_packages` efficiënter (één pip-aanroep).
 
     Parameters:
     - package_name (str): Naam van het package zoals op PyPI (bv. 'requests').
@@ -38,93 +185,42 @@ def update_or_install_if_missing(
     Returns:
     - module: Het geïmporteerde package-object (na installatie of upgrade indien nodig).
     """
+    return ensure_packages({package_name: min_version})[package_name]
 
-    def parse_version(v: str, width: Optional[int] = None) -> list[int]:
-        """
-        Zet een versie-string (bv. '2.10.3' of '2.25.0.1') om naar een lijst van gehele getallen.
-        Indien 'width' is opgegeven, wordt de lijst opgevuld tot die lengte met nullen.
-        Als 'width' None is, wordt de ruwe lijst teruggegeven.
-
-        Parameters:
-        - v (str): Versie als string (bv. '2.10.3').
-        - width (int or None): Minimale lengte van de resulterende lijst (aangevuld met nullen indien nodig).
-
-        Returns:
-        - list[int]: Lijst van gehele getallen.
-
-        Raises:
-        - ValueError: Als een deel van de versie geen geheel getal is (bv. '2.10a1').
-        """
-        parts = v.split('.')
-        int_parts = []
-        for p in parts:
-            if not p.isdigit():
-                raise ValueError(f"Niet-numeriek versieonderdeel: '{p}'")
-            int_parts.append(int(p))
-        if width:
-            return int_parts + [0] * (width - len(int_parts))
-        return int_parts
-
-    def is_version_at_least(current: str, minimum: str) -> bool:
-        """
-        Vergelijkt twee versie-strings op basis van numerieke onderdelen.
-        De kortere lijst wordt opgevuld met nullen zodat beide even lang zijn.
-
-        Parameters:
-        - current (str): Huidige geïnstalleerde versie.
-        - minimum (str): Vereiste minimumversie.
-
-        Returns:
-        - bool: True als current >= minimum, anders False.
-                Geeft ook False terug als de versie niet numeriek vergeleken kan worden.
-        """
-        try:
-            current_parts = parse_version(current)
-            minimum_parts = parse_version(minimum)
-            max_len = max(len(current_parts), len(minimum_parts))
-            current_parts += [0] * (max_len - len(current_parts))
-            minimum_parts += [0] * (max_len - len(minimum_parts))
-            return current_parts >= minimum_parts
-        except ValueError as e:
-            print(f"⚠️  Versie '{current}' is niet numeriek vergelijkbaar ({e}) → installeren/upgrade vereist")
-            return False
+def ensure_packages(
+    requirements: Dict[str, Optional[str]]
+) -> Dict[str, types.ModuleType]:
+    """
+    Zorgt ervoor dat meerdere packages geïnstalleerd zijn en aan hun minimale versie voldoen.
 
-    needs_reload = False  # vlag om te bepalen of we herladen na installatie/upgrade
+    Alle ontbrekende of verouderde packages worden samen in één `pip install`-aanroep geïnstalleerd:
+    pip (en zijn dependency-resolver) wordt zo maar één keer opgestart i.p.v. één keer per package.
 
-    # Controleer of het package al aanwezig is
-    spec = importlib.util.find_spec(package_name)
-    if spec is None:
-        # Package is nog niet geïnstalleerd → installeer het
-        print(f"📦 Module '{package_name}' niet gevonden. Bezig met installeren...")
-        pip_target = f"{package_name}>={min_version}" if min_version else package_name
-        subprocess.check_call([sys.executable, "-m", "pip", "install", pip_target])
-        needs_reload = True
-    else:
-        # Package is reeds aanwezig → importeer het
-        module = importlib.import_module(package_name)
-
-        if min_version:
-            # Controleer de huidige versie (default = '0.0.0' als niet beschikbaar)
-            current_version = getattr(module, "__version__", "0.0.0")
-
-            # Vergelijk versies; upgrade indien nodig
-            if not is_version_at_least(current_version, min_version):
-                print(f"🔁 Upgrade nodig: {package_name} ({current_version} < {min_version})")
-                subprocess.check_call([sys.executable, "-m", "pip", "install", f"{package_name}>={min_version}"])
-
-                # Verwijder het package en submodules uit sys.modules om herladen mogelijk te maken
-                to_delete = [mod for mod in sys.modules if mod == package_name or mod.startswith(package_name + ".")]
-                for mod in to_delete:
-                    del sys.modules[mod]
-
-                needs_reload = True
-
-    # Herlaad het package indien nodig
-    module = importlib.import_module(package_name)
+    Parameters:
+    - requirements (dict[str, str | None]): Package-naam → minimale versie (of None voor geen versiecontrole),
+      bv. {"requests": "2.25.0", "pandas": "2.2.0"}.
 
-    # Toon geïnstalleerde of geüpgradede versie indien herladen
-    if needs_reload:
-        version = getattr(module, "__version__", "onbekend")
-        print(f"✅ Module '{package_name}' geïnstalleerd (versie {version}).")
+    Returns:
+    - dict[str, module]: Package-naam → geïmporteerd package-object.
 
-    return module
\ No newline at end of file
+    Gebruik:
+    ensure_packages({"sqlalchemy": "2.0.0", "tqdm": "4.60.0"})
+    """
+    modules: Dict[str, types.ModuleType] = {}
+    pending: Dict[str, str] = {}
+    for package_name, min_version in requirements.items():
+        cached = _CHECKED.get((package_name, min_version))
+        if cached is not None:
+            modules[package_name] = cached
+            continue
+        pip_target = _pip_target_if_needed(package_name, min_version)
+        if pip_target is not None:
+            pending[package_name] = pip_target
+
+    if pending:
+        subprocess.check_call([sys.executable, "-m", "pip", "install", *pending.values()])
+
+    for package_name, min_version in requirements.items():
+        if package_name not in modules:
+            modules[package_name] = _import_checked(package_name, min_version, package_name in pending)
+    return modules
\ No newline at end of file
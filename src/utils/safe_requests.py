@@ -6,15 +6,70 @@ Bevat de functie `safe_requests_get` - een uitgebreide en veilige wrapper rond `
 Deze module biedt een eenvoudige manier om HTTP GET-verzoeken uit te voeren met foutafhandeling en herhaalde pogingen bij mislukking.
 Ideaal voor scripts die robuust moeten omgaan met tijdelijke netwerk- of serverproblemen (bijv. bij het ophalen van data van externe APIs).
 
+Alle verzoeken lopen via een gedeelde `requests.Session` met connection pooling (HTTP keep-alive), zodat de
+TCP- en TLS-handshake niet bij elk verzoek opnieuw moet gebeuren. De herhaalde pogingen worden afgehandeld
+door urllib3 (`Retry`), inclusief het respecteren van een eventuele `Retry-After`-header.
+
 Voorbeeldgebruik:
     from safe_requests import safe_requests_get
 
     response = safe_requests_get("https://api.example.com/data", tries=5, delay=1)
 """
 
-import time
+import atexit
+from functools import lru_cache
 import requests
-from typing import Optional, Dict, Union
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Optional, Dict, Union, List
+
+# HTTP-statuscodes die op een tijdelijk probleem wijzen en dus opnieuw geprobeerd worden
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Alle aangemaakte sessies, zodat de open connecties bij het afsluiten netjes gesloten worden
+_SESSIONS: List[requests.Session] = []
+
+@lru_cache(maxsize=None)
+def _get_session(
+    tries: int,
+    delay: Union[int, float]
+) -> requests.Session:
+    """
+    Geeft een (herbruikbare) `requests.Session` terug met connection pooling en retry-configuratie.
+
+    Per combinatie van `tries` en `delay` wordt één sessie aangemaakt en bewaard, zodat alle verzoeken
+    met dezelfde instellingen dezelfde open connecties hergebruiken.
+
+    Parameters:
+    - tries (int): Totaal aantal pogingen (eerste poging inbegrepen).
+    - delay (int or float): Backoff-factor (in seconden) tussen de pogingen.
+
+    Retourneert:
+    - session (requests.Session): De gedeelde sessie.
+    """
+    retry = Retry(
+        total=max(tries - 1, 0),
+        backoff_factor=delay,
+        status_forcelist=RETRY_STATUS_CODES,
+        raise_on_status=False,  # laatste response teruggeven zodat raise_for_status() de fout meldt
+    )
+    # Ruim genoeg voor gelijktijdige verzoeken vanuit meerdere threads (bv. maanden x dagen in data_import_tools)
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=retry)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    _SESSIONS.append(session)
+    return session
+
+@atexit.register
+def _close_sessions() -> None:
+    """
+    Sluit alle gedeelde sessies (en hun open connecties) bij het afsluiten van Python.
+    """
+    for session in _SESSIONS:
+        session.close()
+    _SESSIONS.clear()
+    _get_session.cache_clear()
 
 def safe_requests_get(
     url: str,
@@ -22,23 +77,26 @@ def safe_requests_get(
     headers: Optional[Dict[str, str]] = None,
     tries: int = 3,
     delay: Union[int, float] = 2,
-    timeout: Union[int, float] = 10
+    timeout: Union[int, float] = 10,
+    session: Optional[requests.Session] = None
 ) -> requests.Response:
     """
     Uitgebreide en veilige versie van requests.get() met ingebouwde retry-logica.
 
-    Deze functie probeert een HTTP GET-verzoek uit te voeren naar de opgegeven URL.
-    Als het verzoek faalt door een netwerkfout of een HTTP-fout (zoals 5xx of 4xx-status),
+    Deze functie voert een HTTP GET-verzoek uit naar de opgegeven URL via een gedeelde sessie (connection pooling).
+    Als het verzoek faalt door een netwerkfout of een tijdelijke serverfout (429 of 5xx),
     wordt het verzoek automatisch opnieuw geprobeerd tot een maximum van `tries` keer.
-    Na elke mislukte poging wordt `delay` seconden gewacht alvorens opnieuw te proberen.
+    Tussen de pogingen wordt exponentieel langer gewacht, met `delay` als backoff-factor.
 
     Parameters:
     - url (str): De URL waarnaar het GET-verzoek wordt verzonden.
     - params (dict, optional): Optionele query parameters toe te voegen aan het verzoek.
     - headers (dict, optional): Optionele headers om mee te sturen met het verzoek.
     - tries (int): Aantal pogingen bij fouten. Standaard is 3.
-    - delay (int or float): Wachtijd (in seconden) tussen pogingen. Standaard is 2.
+    - delay (int or float): Backoff-factor (in seconden) tussen pogingen. Standaard is 2.
     - timeout (int or float): Maximum wachttijd voor een antwoord van de server. Standaard is 10 seconden.
+    - session (requests.Session, optional): Eigen sessie om te gebruiken. Standaard wordt de gedeelde sessie
+      voor `tries`/`delay` gebruikt; bij een eigen sessie bepaalt die sessie zelf het retry-gedrag.
 
     Retourneert:
     - response (requests.Response): Het response-object als het verzoek succesvol was.
@@ -50,20 +108,9 @@ def safe_requests_get(
     response = safe_requests_get("https://api.example.com/data", tries=5, delay=1)
 
     """
-    # Lokale kopie van tries maken zodat de oorspronkelijke waarde behouden blijft bij hergebruik
-    _tries = tries
-    while _tries > 1:
-        try:
-            response = requests.get(url, params=params, headers=headers, timeout=timeout)
-            # Roep een uitzondering op bij een HTTP-statuscode die een fout aangeeft (4xx of 5xx)
-            response.raise_for_status()
-            return response
-        except (requests.exceptions.RequestException, requests.exceptions.HTTPError) as e:
-            print(f"⚠️ Request fout: {e}. Nog {_tries-1} pogingen... Wacht {delay}s.")
-            # Wacht voor het opgegeven aantal seconden
-            time.sleep(delay)
-            _tries -= 1
-    # Laatste poging buiten de loop: als deze faalt, wordt de uitzondering niet meer opgevangen
-    response = requests.get(url, params=params, headers=headers, timeout=timeout)
+    if session is None:
+        session = _get_session(tries, delay)
+    response = session.get(url, params=params, headers=headers, timeout=timeout)
+    # Roep een uitzondering op bij een HTTP-statuscode die een fout aangeeft (4xx of 5xx)
     response.raise_for_status()
-    return response
\ No newline at end of file
+    return response
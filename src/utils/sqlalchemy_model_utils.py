@@ -14,6 +14,9 @@ Voorbeeldgebruik:
     print(alle_modellen_en_kolommen(Base))
 """
 
+# Bewaarde overzichten per basisklasse en modelset (zie alle_modellen_en_kolommen)
+_CACHE = {}
+
 def get_all_subclasses(cls):
     """Recursief alle subklassen ophalen."""
     subclasses = []
@@ -47,10 +50,23 @@ def alle_modellen_en_kolommen(base_class):
             - de constraints op de tabel
             - de indexen op de tabel
     """
+    # De modellen wijzigen zelden nadat ze gedefinieerd zijn: het overzicht wordt bewaard per basisklasse
+    # en per set modelklassen met hun kolommen (naam + type). Een nieuw model of een toegevoegde, hernoemde
+    # of anders getypeerde kolom vernieuwt het overzicht; enkel een gewijzigde beschrijving, constraint
+    # of index zonder kolomwijziging wordt niet opgemerkt.
+    subclasses = get_all_subclasses(base_class)
+    key = (base_class, tuple(
+        (cls, tuple((kolom.name, str(kolom.type)) for kolom in cls.__table__.columns))
+        for cls in subclasses if hasattr(cls, '__table__')
+    ))
+    cached = _CACHE.get(key)
+    if cached is not None:
+        return cached
+
     uitvoer = []
 
     # Doorloop alle subklassen (modellen) die van base_class zijn afgeleid
-    for cls in get_all_subclasses(base_class):
+    for cls in subclasses:
         # Alleen concrete modellen met een __tablename__
         if hasattr(cls, '__tablename__') and hasattr(cls, '__table__'):
             uitvoer.append(f"Model: {cls.__name__} (tabel: {cls.__tablename__})")
@@ -68,19 +84,22 @@ def alle_modellen_en_kolommen(base_class):
                     uitvoer.append(f"  - {kolom_naam}")
 
             # Voeg constraint-informatie toe
+            # (constraints en indexen zijn sets in SQLAlchemy: sorteren geeft bij elke run dezelfde uitvoer)
             if cls.__table__.constraints:
                 uitvoer.append("\n  Constraints:")
-                for constraint in cls.__table__.constraints:
+                for constraint in sorted(cls.__table__.constraints, key=lambda c: (type(c).__name__, str(c))):
                     uitvoer.append(f"    - {type(constraint).__name__}: {str(constraint)}")
 
             # Voeg index-informatie toe
             if cls.__table__.indexes:
                 uitvoer.append("\n  Indexen:")
-                for index in cls.__table__.indexes:
+                for index in sorted(cls.__table__.indexes, key=lambda i: i.name or ""):
                     uitvoer.append(f"    - {index.name}: columns={[col.name for col in index.columns]}")
 
 
 
             uitvoer.append("")
 
-    return "\n".join(uitvoer)
\ No newline at end of file
+    result = "\n".join(uitvoer)
+    _CACHE[key] = result
+    return result
\ No newline at end of file
@@ -43,27 +43,33 @@ from src.data_extraction import (
     get_solar_dataframe,
     get_belpex_pivot,
     get_belpex_hourly_pivot,
+    get_belpex_raw_dataframe,
     get_negative_price_counts_pivot,
-    get_combined_dataframe,
-    execute_query
+    get_combined_dataframe
 )
-from src.utils.localization import TRANSLATIONS, LangCode, get_month_name
+from src.utils.localization import TRANSLATIONS, LangCode, months_from_series
 from typing import Literal
-from src.utils.package_tools import update_or_install_if_missing
+from src.utils.package_tools import ensure_packages
+from settings import SKIP_DEP_CHECK
 
 # Controleer en installeer indien nodig de vereiste modules
 # Dit is een vangnet als de gebruiker geen rekening houdt met requirements.txt.
-update_or_install_if_missing("matplotlib","3.5.0")
-update_or_install_if_missing("seaborn","0.11.0")
-update_or_install_if_missing("pandas","1.3.0")
-update_or_install_if_missing("plotly","5.0")
-update_or_install_if_missing("nbformat","4.2.0")
+# In een reeds ingerichte omgeving kan deze controle overgeslagen worden via SKIP_DEP_CHECK=1.
+# Plotly (en nbformat) worden pas gecontroleerd en ingeladen in plot_interactive(),
+# zodat de statische grafieken niet moeten wachten op het (trage) inladen van plotly.
+if not SKIP_DEP_CHECK:
+    # Alle ontbrekende of verouderde packages worden samen in één pip-aanroep geïnstalleerd.
+    ensure_packages({
+        "matplotlib": "3.5.0",
+        "seaborn": "0.11.0",
+        "pandas": "2.2.0",
+    })
 
 # Pas na eventuele installatie importeren
 import matplotlib.pyplot as plt
 import seaborn as sns
 import pandas as pd
-import plotly.express as px
+import numpy as np
 
 # -------------------------------------------------------------------
 # 🌬️ Windproductie - opsplitsing Offshore/Onshore
@@ -98,8 +104,9 @@ def plot_wind_split(lang: LangCode = "nl", short: bool = True) -> None:
         print(TRANSLATIONS["errors"]["no_data_to_plot"][lang])
         return
  
-    for category in pivot_wind.index.get_level_values(0).unique():
-        data = pivot_wind.loc[category]
+    # groupby(level=0) geeft elke categorie meteen als deel-DataFrame terug (geen .loc-opzoeking per categorie)
+    for category, data in pivot_wind.groupby(level=0, sort=False):
+        data = data.droplevel(0)
         data.plot(kind='bar', stacked=True, figsize=(12,6), colormap='viridis')
         plt.title(f'{TRANSLATIONS["titles"]["wind_split"][lang]} - {category}')
         plt.xlabel(TRANSLATIONS["year"][lang])
@@ -426,6 +433,11 @@ def plot_interactive(
             De functie toont de grafiek interactief in de browser
             (of notebook) en geeft geen waarde terug.
     """
+    # Plotly pas hier inladen (zie de imports bovenaan)
+    if not SKIP_DEP_CHECK:
+        ensure_packages({"plotly": "5.0", "nbformat": "4.2.0"})
+    import plotly.express as px
+
     if energytype == "wind":
         df = get_wind_dataframe_total()
         title = TRANSLATIONS["titles"]["wind_total"][lang]
@@ -445,10 +457,7 @@ def plot_interactive(
     df = df.sort_values(["year", "month"])
 
     # Omzetten van maandnummers naar maandnamen
-    df["month"] = [
-        get_month_name(m, lang=lang, short=short)
-        for m in df["month"]
-    ]
+    df["month"] = months_from_series(df["month"], lang=lang, short=short)
 
     year_col = TRANSLATIONS["year"][lang]
     month_col = TRANSLATIONS["month"][lang]
@@ -669,7 +678,6 @@ def plot_belpex_hourly(
         bbox_to_anchor=(1.05, 1),                   # zet legende rechts van de plot
         loc='upper left'                            # ankerpunt van legende
     )
-    plt.tight_layout()  # zorgt dat alles netjes binnen de figuur past
     plt.grid(True, linestyle='--', alpha=0.5)
 
     # Bronvermelding linksbovenaan
@@ -717,10 +725,11 @@ def plot_negative_price_counts_cumulative(lang: LangCode = "nl", short: bool = T
     cumulative = pivot.cumsum(axis=1)
 
     plt.figure(figsize=(12, 6))
-    for year in cumulative.index:
+    # Rijen rechtstreeks uit de NumPy-array i.p.v. een .loc-opzoeking (en Series-kopie) per jaar
+    for year, values in zip(cumulative.index, cumulative.to_numpy()):
         plt.plot(
             cumulative.columns,
-            cumulative.loc[year],
+            values,
             #marker='o',
             label=str(year)
         )
@@ -766,12 +775,12 @@ def plot_negative_price_counts_bubble(lang: str = "nl", short: bool = True):
     
     plt.figure(figsize=(12, 6))
     
-    # Voor elke jaar een scatter plot
-    for year in pivot.index:
+    # Voor elke jaar een scatter plot (eigen kleur en legenda-item per jaar)
+    for year, counts in zip(pivot.index, pivot.to_numpy()):
         plt.scatter(
             pivot.columns,                  # x = maand
             [year]*len(pivot.columns),      # y = jaar
-            s=pivot.loc[year]*10,           # bubble size = aantal uren * schaalfactor
+            s=counts*10,                    # bubble size = aantal uren * schaalfactor
             alpha=0.6,                      # transparantie
             label=str(year)
         )
@@ -821,14 +830,10 @@ def plot_belpex_price_distribution(lang: LangCode = "nl") -> None:
             Toont de grafiek via matplotlib en geeft niets terug.
     """
 
-    query = """
-        SELECT year, month, price_eur_per_MWh
-        FROM tbl_belpex_prices
-    """
-
-    df = execute_query(query)
+    # Zelfde (gecachte) ruwe uurprijzen als voor de telling van negatieve prijzen
+    df = get_belpex_raw_dataframe()
 
-    if df.empty:
+    if df is None or df.empty:
         print(TRANSLATIONS["errors"]["no_data_to_plot"][lang])
         return
 
@@ -918,14 +923,12 @@ def plot_combined(lang: LangCode = "nl", short: bool = True) -> None:
         print(TRANSLATIONS["errors"]["no_data_to_plot"][lang])
         return
 
-    # Maak een continue x-index voor plotting
-    df_compare['x_index'] = range(len(df_compare))
-
     # Overzetten naar Numpy arrays om sneller te verwerken
+    # (de continue x-index voor plotting rechtstreeks als array, zonder extra kolom in de DataFrame)
+    x_index = np.arange(len(df_compare))
     wind_vals = df_compare['wind_GWh'].to_numpy()
     solar_vals = df_compare['solar_GWh'].to_numpy()
     belpex_vals = df_compare['belpex_EUR_per_MWh'].to_numpy()
-    x_index = df_compare['x_index'].to_list()
 
     max_prod = (wind_vals + solar_vals).max()
     max_price = belpex_vals.max()
@@ -967,7 +970,7 @@ def plot_combined(lang: LangCode = "nl", short: bool = True) -> None:
     # Piek 1: maart 2022
     peak1_mask = (df_compare["year"] == 2022) & (df_compare["month"] == 3)
     if peak1_mask.any():
-        x_peak1 = df_compare.loc[peak1_mask, "x_index"].iloc[0]
+        x_peak1 = np.flatnonzero(peak1_mask)[0]
         ax2.annotate(
             TRANSLATIONS["labels"]["peak1"][lang],
             xy=(x_peak1, belpex_vals[x_peak1]),
@@ -988,7 +991,7 @@ def plot_combined(lang: LangCode = "nl", short: bool = True) -> None:
     # Piek 2: augustus 2022
     peak2_mask = (df_compare["year"] == 2022) & (df_compare["month"] == 8)
     if peak2_mask.any():
-        x_peak2 = df_compare.loc[peak2_mask, "x_index"].iloc[0]
+        x_peak2 = np.flatnonzero(peak2_mask)[0]
         ax2.annotate(
             TRANSLATIONS["labels"]["peak2"][lang],
             xy=(x_peak2, belpex_vals[x_peak2]),
@@ -1008,18 +1011,18 @@ def plot_combined(lang: LangCode = "nl", short: bool = True) -> None:
 
     # X-as opmaak: maandnamen
     ax1.set_xticks(x_index)
-    ax1.set_xticklabels(df_compare['month_name'], rotation=90)
+    ax1.set_xticklabels(df_compare['month_name'].to_numpy(), rotation=90)
 
     # Jaarscheiding en labels
-    years = df_compare['year'].unique()
-    for y in years:
-        year_mask = df_compare['year'] == y
-        xpos_mean = df_compare.loc[year_mask, 'x_index'].mean()
-        
-        # Jaarlabel onder de maandnamen
-        # Dynamische offset op basis van short/full maandnamen
-        y_offset = -max_prod * (0.2 if not short else 0.10)
+    # Midden en laatste x-positie van elk jaar in één groupby i.p.v. een masker per jaar
+    year_positions = pd.Series(x_index).groupby(df_compare['year'].to_numpy(), sort=False).agg(['mean', 'max'])
+    last_year = year_positions.index[-1]
+
+    # Jaarlabel onder de maandnamen
+    # Dynamische offset op basis van short/full maandnamen
+    y_offset = -max_prod * (0.2 if not short else 0.10)
 
+    for y, xpos_mean, last_x in year_positions.itertuples():
         ax1.text(
             xpos_mean,
             y_offset,
@@ -1031,8 +1034,7 @@ def plot_combined(lang: LangCode = "nl", short: bool = True) -> None:
         )
         
         # Verticale scheiding (behalve laatste jaar)
-        if y != years[-1]:
-            last_x = df_compare.loc[year_mask, 'x_index'].max()
+        if y != last_year:
             ax1.axvline(x=last_x + 0.5, color='gray', linestyle='--', alpha=0.5)
 
     # Titel en layout